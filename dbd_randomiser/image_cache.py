@@ -0,0 +1,283 @@
+# image_cache.py
+import os, hashlib, threading
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QStandardPaths, pyqtSignal
+from PyQt6.QtGui  import QPixmap, QPixmapCache, QImage, QImageReader
+
+# Hot-path lookups bound once at import
+_KEEP_AR = Qt.AspectRatioMode.KeepAspectRatio
+_SMOOTH  = Qt.TransformationMode.SmoothTransformation
+_FAST    = Qt.TransformationMode.FastTransformation
+
+# Scaled copies kept on disk across runs, pruned oldest-first past this size
+DISK_CACHE_LIMIT = 64 * 1024 * 1024  # bytes
+
+_disk_dir = None
+
+def _disk_cache_dir():
+    """Folder holding pre-scaled copies across runs, or "" if there's nowhere to write."""
+    global _disk_dir
+    if _disk_dir is None:
+        root   = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        folder = os.path.join(root, "scaled") if root else ""
+        if folder:
+            try:
+                os.makedirs(folder, exist_ok=True)
+            except OSError:
+                folder = ""
+        _disk_dir = folder
+    return _disk_dir
+
+def _disk_copy(path, size):
+    """Where `path` at `size` lives on disk ("" without a cache folder), and its image if current."""
+    folder = _disk_cache_dir()
+    if not folder:
+        return "", None
+    digest = hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()
+    cached = os.path.join(folder, f"{digest}_{size}.png")
+    try:
+        fresh = os.stat(cached).st_mtime >= os.stat(path).st_mtime
+    except OSError:
+        fresh = False
+    if fresh:
+        img = QImage(cached)
+        if not img.isNull():
+            try:
+                os.utime(cached)  # mark it recently used, for _prune_disk_cache
+            except OSError:
+                pass
+            return cached, img
+    return cached, None
+
+def _write_disk_copy(cached, img):
+    """Save `img` as the on-disk copy `cached`; call off the GUI thread."""
+    # write under a per-thread name and swap in, so readers never see half a file
+    tmp = f"{cached}.{threading.get_ident()}.tmp"
+    try:
+        if img.save(tmp, "PNG"):
+            os.replace(tmp, cached)
+    except OSError:
+        pass
+
+def _read_scaled(path, size, write=False):
+    """Scaled image for `path`, from the on-disk copy when it's newer than the source.
+
+    With `write`, a fresh decode is also saved as the on-disk copy; only
+    the pool workers and the prescale tool ask for that.
+    """
+    cached, img = _disk_copy(path, size)
+    if img is not None:
+        return img
+    img = _decode_scaled(path, size)
+    if write and cached and not img.isNull():
+        _write_disk_copy(cached, img)
+    return img
+
+def _prune_disk_cache(limit=DISK_CACHE_LIMIT):
+    """Delete the least recently used on-disk copies until the folder is under `limit` bytes.
+
+    Copies are named by a hash of their source's absolute path, so moving the
+    app or renaming assets leaves the old ones orphaned; this is what bounds them.
+    """
+    folder = _disk_cache_dir()
+    if not folder:
+        return
+    entries = []
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if e.is_file():
+                    st = e.stat()
+                    entries.append((st.st_mtime, st.st_size, e.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+def prescale(path, size):
+    """Write (or refresh) the on-disk scaled copy of `path`; False if it couldn't be decoded."""
+    return not _read_scaled(path, size, write=True).isNull()
+
+def _decode_scaled(path, size):
+    """Decode `path` straight to its scaled size, so the codec can skip work where it supports it."""
+    reader = QImageReader(path)
+    if not reader.canRead():
+        return QImage(path).scaled(size, size, _KEEP_AR, _SMOOTH)
+    src = reader.size()
+    if src.isValid():
+        target = src.scaled(size, size, _KEEP_AR)
+        if target != src:  # icons already at view size are read as-is
+            reader.setScaledSize(target)
+    return reader.read()
+
+class _DecodeTask(QRunnable):
+    """Decode and scale one PNG on a worker thread (QImage is thread-safe, QPixmap is not)."""
+
+    def __init__(self, path, size, cache):
+        super().__init__()
+        self.path  = path
+        self.size  = size
+        self.cache = cache
+
+    def run(self):
+        img = _read_scaled(self.path, self.size, write=True)
+        try:
+            self.cache.decoded.emit(self.path, self.size, img)
+        except RuntimeError:
+            pass  # app shut down before the decode finished
+
+class _DiskTask(QRunnable):
+    """Run one on-disk cache chore (a copy write or a prune) on a worker thread."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn   = fn
+        self.args = args
+
+    def run(self):
+        self.fn(*self.args)
+
+class _ListTask(QRunnable):
+    """List asset folders on a worker thread and hand their PNG paths back for decoding."""
+
+    def __init__(self, folders, size, nested, cache):
+        super().__init__()
+        self.folders = folders
+        self.size    = size
+        self.nested  = nested
+        self.cache   = cache
+
+    def run(self):
+        # a missing or unreadable folder is skipped, not raised on the pool,
+        # so it can't end the app or stop the other folders prefetching
+        folders = self.folders
+        if self.nested:
+            folders = []
+            for root in self.folders:
+                try:
+                    with os.scandir(root) as it:
+                        folders.extend(e.path for e in it if e.is_dir())
+                except OSError as e:
+                    print(f"[WARNING] Skipping prefetch of {root}: {e}")
+        paths = []
+        for f in folders:
+            try:
+                paths.extend(os.path.join(f, n) for n in self.cache.listing(f))
+            except OSError as e:
+                print(f"[WARNING] Skipping prefetch of {f}: {e}")
+        try:
+            self.cache.listed.emit(paths, self.size)
+        except RuntimeError:
+            pass  # app shut down before the listing finished
+
+class ImageCache(QObject):
+    """Scaled pixmaps and folder listings shared by every randomiser view.
+
+    Pixmaps live in Qt's size-bounded QPixmapCache under "path@size" keys.
+    Background decodes land back on the GUI thread through `decoded`, since
+    QPixmapCache may only be touched there. Listings stay cached until
+    `invalidate` is called for their folder.
+    """
+    decoded = pyqtSignal(str, int, QImage)
+    listed  = pyqtSignal(object, int)
+
+    def __init__(self):
+        super().__init__()
+        self._pending  = set()  # "path@size" keys queued on the pool
+        self._listings = {}     # folder -> PNG names
+        self.decoded.connect(self._store_decoded)
+        self.listed.connect(self.prefetch)
+
+    def get(self, path, size, smooth=True, fallback=None):
+        """Return `path` scaled to `size`, decoding and scaling it only once.
+
+        Spin frames pass smooth=False: they're on screen for one tick, so on
+        a miss the file is queued on the pool and the caller's `fallback`
+        (its placeholder) is shown instead of decoding on the GUI thread.
+        Without a fallback the frame is decoded here, from the smooth copy
+        on disk when there's a current one, otherwise with a cheap
+        nearest-neighbour scale.
+        """
+        key = f"{path}@{size}"
+        pix = QPixmapCache.find(key)
+        if pix is not None and not pix.isNull():
+            return pix
+        if not smooth:
+            pix = QPixmapCache.find(key + ":fast")
+            if pix is None or pix.isNull():
+                if fallback is not None:
+                    self.prefetch((path,), size)
+                    return fallback
+                _, img = _disk_copy(path, size)
+                if img is not None:
+                    pix = QPixmap.fromImage(img)
+                    QPixmapCache.insert(key, pix)
+                else:
+                    # scale as a QImage and convert once, rather than scaling a
+                    # full-size QPixmap that's thrown away straight after
+                    pix = QPixmap.fromImage(QImage(path).scaled(size, size, _KEEP_AR, _FAST))
+                    QPixmapCache.insert(key + ":fast", pix)
+            return pix
+        # decode and scale only here; the on-disk copy is written on the pool
+        cached, img = _disk_copy(path, size)
+        if img is None:
+            img = _decode_scaled(path, size)
+            if cached and not img.isNull():
+                QThreadPool.globalInstance().start(_DiskTask(_write_disk_copy, cached, img))
+        pix = QPixmap.fromImage(img)
+        QPixmapCache.insert(key, pix)
+        return pix
+
+    def prefetch(self, paths, size):
+        """Queue background decodes for any of `paths` not cached or already in flight."""
+        pool = QThreadPool.globalInstance()
+        for path in paths:
+            key = f"{path}@{size}"
+            if key in self._pending:
+                continue
+            pix = QPixmapCache.find(key)
+            if pix is None or pix.isNull():
+                self._pending.add(key)
+                pool.start(_DecodeTask(path, size, self))
+
+    def prefetch_folders(self, folders, size, nested=False):
+        """Like `prefetch` for every PNG in `folders` (or in their direct
+        subfolders when `nested`), listing them on the pool as well."""
+        QThreadPool.globalInstance().start(_ListTask(folders, size, nested, self))
+
+    def prune_disk_cache(self):
+        """Trim the on-disk scaled copies to DISK_CACHE_LIMIT on the pool."""
+        QThreadPool.globalInstance().start(_DiskTask(_prune_disk_cache))
+
+    def _store_decoded(self, path, size, img):
+        # a synchronous get may have beaten the worker to it
+        key = f"{path}@{size}"
+        self._pending.discard(key)
+        cached = QPixmapCache.find(key)
+        if cached is None or cached.isNull():
+            QPixmapCache.insert(key, QPixmap.fromImage(img))
+
+    def listing(self, folder):
+        """Names of the PNG files directly inside `folder`, scanned once.
+
+        Safe to call from the scan workers: each folder's entry is a single
+        dict store, so a racing duplicate scan only overwrites equal data.
+        """
+        names = self._listings.get(folder)
+        if names is None:
+            with os.scandir(folder) as it:
+                names = tuple(e.name for e in it if e.is_file() and e.name.lower().endswith(".png"))
+            self._listings[folder] = names
+        return names
+
+    def invalidate(self, folder):
+        """Drop `folder`'s cached listing so the next `listing` call rescans it."""
+        self._listings.pop(folder, None)
+
+image_cache = ImageCache()
@@ -5,11 +5,14 @@ Initializes the QApplication and shows the main window.
 
 import sys, traceback
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui     import QPixmapCache
 from ui_main_window import MainWindow
 
 def main():
     """Create the app, show the main window, and start the event loop."""
     app = QApplication(sys.argv)
+    app.setApplicationName("dbdPerkRoulette")  # names the scaled-image cache folder
+    QPixmapCache.setCacheLimit(64 * 1024)  # KB; room for every scaled icon
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
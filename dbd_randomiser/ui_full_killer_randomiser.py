@@ -1,16 +1,19 @@
-import os, random
+import random
+import time
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel
 from PyQt6.QtCore    import Qt, QTimer
-from PyQt6.QtGui     import QPixmap
 
-from widgets import AnimatedButton, ClickableLabel
-from ui_killer_randomiser import KillerDisplay
+from widgets import AnimatedButton
+from utils import spin_step
+from image_cache import image_cache
+from ui_killer_randomiser import KillerDisplay, image_path
 from ui_perk_display       import PerkDisplay, IMAGE_SIZE
 
 SPIN_INTERVAL = 100
 SPIN_STEPS    = 20
 PERK_CONTAINER_WIDTH  = 160
 PERK_CONTAINER_HEIGHT = 160 + 60
+ADDON_SIZE            = 110
 
 class FullDisplay(QWidget):
     """Spin killer-perks grid → portrait+name → addons, all in one view, with per-icon reroll animations."""
@@ -26,26 +29,42 @@ class FullDisplay(QWidget):
             click_sound=click_sound
         )
         self.pd = PerkDisplay(
-            "images/killer_perks",
+            image_path("killer_perks"),
             back_callback=back_callback,
             hover_sound=hover_sound,
             click_sound=click_sound
         )
 
+        # PerkDisplay and KillerDisplay already warm the shared cache with
+        # every perk and addon under the keys the reroll spins use
+        self._perk_paths = self.pd._perk_paths
+
         # Hide built-in Spin/Back buttons
-        for btn in (*self.kd.findChildren(AnimatedButton), *self.pd.findChildren(AnimatedButton)):
+        for btn in (self.kd.spin_btn, self.kd.back_btn,
+                    self.pd.spin_button, self.pd.back_button):
             btn.hide()
 
         # --- State for per-icon animations ---
-        self._single_perk_idx = None
-        self._single_perk_counter = 0
-        self._perk_timer = QTimer(self)
-        self._perk_timer.timeout.connect(self._animate_single_perk)
-
-        self._single_addon_idx = None
-        self._single_addon_counter = 0
-        self._addon_timer_single = QTimer(self)
-        self._addon_timer_single.timeout.connect(self._animate_single_addon)
+        # Spin frames walk a pre-shuffled index order per icon instead of
+        # drawing a fresh random.choice on every tick. Each spin binds its
+        # (paths, order, label) context once when it starts, so ticks don't
+        # re-resolve attribute chains or the killer's addon folder.
+        self._spin_rng  = random.Random()
+        self._perk_ctx  = [None] * len(self.pd.image_labels)
+        self._addon_ctx = [None] * len(self.kd.addon_labels)
+
+        # One timer drives the full sequence and every per-icon reroll;
+        # _active maps (kind, idx) -> the time.monotonic() each running spin started at
+        self._phase    = 0
+        self._active   = {}
+        self._handlers = {
+            "seq":   self._step,
+            "perk":  self._animate_single_perk,
+            "addon": self._animate_single_addon,
+        }
+        self._tick = QTimer(self)
+        self._tick.setTimerType(Qt.TimerType.PreciseTimer)
+        self._tick.timeout.connect(self._on_tick)
 
         # --- Override click handlers and set tooltips ---
         # Portrait reroll: only portrait
@@ -114,6 +133,9 @@ class FullDisplay(QWidget):
         )
         spin_all.setFixedSize(220, 50)
         spin_all.clicked.connect(self._start)
+        # KillerDisplay scans its folders in the background
+        spin_all.setEnabled(self.kd._ready)
+        self.kd.ready.connect(lambda: spin_all.setEnabled(True))
 
         back = AnimatedButton(
             "Back",
@@ -132,61 +154,88 @@ class FullDisplay(QWidget):
         tip.setStyleSheet("color: #ccc; font-size: 8pt;")
         main.addWidget(tip, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        # Sequencer timer for full spin
-        self._phase = 0
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._step)
+    def _activate(self, kind, idx=None):
+        """Register a spin with the shared timer, (re)starting its clock now."""
+        self._active[(kind, idx)] = time.monotonic()
+        if not self._tick.isActive():
+            self._tick.start(SPIN_INTERVAL)
+
+    def _on_tick(self):
+        for key in list(self._active):
+            kind, idx = key
+            # steps come from elapsed time, so a late tick doesn't lengthen a spin
+            if self._handlers[kind](idx, spin_step(self._active[key], SPIN_INTERVAL)):
+                del self._active[key]
+        if not self._active:
+            self._tick.stop()
+
+    def hideEvent(self, event):
+        # the main window's page stack keeps this view alive while hidden;
+        # the embedded displays are never shown themselves, so pause them here
+        self._tick.stop()
+        self.kd._tick.stop()
+        self.pd._tick.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._active:
+            self._tick.start(SPIN_INTERVAL)
+        for sub in (self.kd, self.pd):
+            if sub._channels:
+                sub._tick.start(SPIN_INTERVAL)
 
     def _start(self):
         """Begin full portrait → addons → perks sequence."""
         self._phase = 1
         self.kd._start_portrait()
-        self._timer.start(SPIN_INTERVAL)
+        self._activate("seq")
 
-    def _step(self):
-        if self._phase == 1 and self.kd._portrait_counter > SPIN_STEPS:
+    def _step(self, _idx, _count, _steps=SPIN_STEPS):
+        if self._phase == 1 and self.kd._portrait_step > _steps:
             self.kd._start_addons()
             self._phase = 2
-        elif self._phase == 2 and self.kd._addon_counter > SPIN_STEPS:
+        elif self._phase == 2 and self.kd._addon_step > _steps:
             self.pd._start_spin()
             self._phase = 3
-        elif self._phase == 3 and self.pd._spin_counter > SPIN_STEPS:
-            self._timer.stop()
+        elif self._phase == 3 and self.pd._spin_step > _steps:
+            return True
+        return False
+
+    def _spin_order(self, n):
+        """Shuffled indices into `n` files, cycled through by one spin."""
+        return self._spin_rng.sample(range(n), min(n, SPIN_STEPS + 1))
 
     # --- Individual reroll with animation ---
     def _reroll_perk_full(self, idx):
-        self._single_perk_idx = idx
-        self._single_perk_counter = 0
-        self._perk_timer.start(SPIN_INTERVAL)
-
-    def _animate_single_perk(self):
-        idx = self._single_perk_idx
-        self._single_perk_counter += 1
-        choice = random.choice(self.pd.perk_files)
-        pix = QPixmap(os.path.join(self.pd.perk_folder, choice))
-        pix = pix.scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.pd.image_labels[idx].setPixmap(pix)
-        if self._single_perk_counter > SPIN_STEPS:
-            self._perk_timer.stop()
+        paths = self._perk_paths
+        self._perk_ctx[idx] = (paths, self._spin_order(len(paths)), self.pd.image_labels[idx])
+        self._activate("perk", idx)
+
+    def _animate_single_perk(self, idx, count, _steps=SPIN_STEPS):
+        paths, order, label = self._perk_ctx[idx]
+        label.setPixmap(image_cache.get(paths[order[count % len(order)]], IMAGE_SIZE, smooth=False, fallback=self.pd._placeholder_pix))
+        if count > _steps:
             self.pd._reroll_perk(idx)
+            return True
+        return False
 
     def _reroll_addon_full(self, idx):
-        self._single_addon_idx = idx
-        self._single_addon_counter = 0
-        self._addon_timer_single.start(SPIN_INTERVAL)
-
-    def _animate_single_addon(self):
-        idx = self._single_addon_idx
-        self._single_addon_counter += 1
-        key = self.kd.name_label.text().replace(" ", "")
-        folder = os.path.join(self.kd.addons_root, key)
-        if not os.path.isdir(folder):
-            self._addon_timer_single.stop()
-            return
-        files = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
-        path = os.path.join(folder, random.choice(files))
-        pix = QPixmap(path).scaled(110, 110, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.kd.addon_labels[idx].setPixmap(pix)
-        if self._single_addon_counter > SPIN_STEPS:
-            self._addon_timer_single.stop()
-            self.kd._reroll_addon(idx)
\ No newline at end of file
+        key = self.kd._killer_key
+        if key:
+            # revalidate against disk through KillerDisplay, whose listing
+            # also decides the final pick in _reroll_addon
+            self.kd.refresh_addons(key)
+        paths = self.kd._addon_paths(key)
+        self._addon_ctx[idx] = (paths, self._spin_order(len(paths)), self.kd.addon_labels[idx])
+        self._activate("addon", idx)
+
+    def _animate_single_addon(self, idx, count, _steps=SPIN_STEPS):
+        paths, order, label = self._addon_ctx[idx]
+        if not paths:
+            return True
+        label.setPixmap(image_cache.get(paths[order[count % len(order)]], ADDON_SIZE, smooth=False, fallback=self.kd._placeholder_small))
+        if count > _steps:
+            self.kd._reroll_addon(idx)
+            return True
+        return False
\ No newline at end of file
@@ -2,12 +2,12 @@
 import os
 import random
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLabel
-from PyQt6.QtCore    import Qt, QTimer
-from PyQt6.QtGui     import QPixmap
+from PyQt6.QtCore    import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
 from widgets         import AnimatedButton, ClickableLabel
 from ui_perk_display import PerkDisplay
-from utils           import format_perk_name
+from utils           import format_perk_name, pick_two, pick_other
+from image_cache     import image_cache
 
 # Configuration constants
 PERK_FRAME    = 160
@@ -16,9 +16,58 @@ IMAGE_SIZE    = 128
 SPIN_INTERVAL = 100
 SPIN_STEPS    = 20
 
+# Stylesheets shared by every make_cell cell
+_FRAME_QSS = """
+    background-color: rgba(0,0,0,150);
+    border: 2px solid #222;
+    border-radius: 10px;
+"""
+_LABEL_QSS = """
+    color: white; font-size: 10pt; font-weight: bold;
+    background: transparent;
+"""
+
+_BASE = os.path.dirname(os.path.abspath(__file__))
+
 def image_path(*parts):
-    base = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base, "images", *parts)
+    return os.path.join(_BASE, "images", *parts)
+
+def _scan_addon_folder(folder):
+    """Names and full paths of the PNGs in one addon folder."""
+    names = image_cache.listing(folder)
+    return names, tuple(os.path.join(folder, n) for n in names)
+
+def _scan_assets(survivor_folder, item_folder, addons_root):
+    """Survivor and item names plus every item's addon folder; runs on the thread pool."""
+    addons = {}
+    with os.scandir(addons_root) as it:
+        for entry in it:
+            if entry.is_dir():
+                mtime = entry.stat().st_mtime
+                addons[entry.name] = (mtime, *_scan_addon_folder(entry.path))
+    return image_cache.listing(survivor_folder), image_cache.listing(item_folder), addons
+
+class _ScanSignals(QObject):
+    scanned = pyqtSignal(object)
+
+class _ScanTask(QRunnable):
+    """Enumerate the asset folders on a worker thread, off the first paint."""
+
+    def __init__(self, scan, args, signals):
+        super().__init__()
+        self.scan    = scan
+        self.args    = args
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.scan(*self.args)
+        except OSError as e:
+            result = e  # missing or unreadable folder; _on_scanned reports it
+        try:
+            self.signals.scanned.emit(result)
+        except RuntimeError:
+            pass  # display was closed before the scan finished
 
 class FullSurvivorDisplay(QWidget):
     """Full‑screen Survivor randomiser: portrait → item → 2 addons → 4 perks,
@@ -38,18 +87,31 @@ class FullSurvivorDisplay(QWidget):
         self.addons_root     = image_path("survivor_items", "addons")
         self.perk_folder     = image_path("survivor_perks")
 
-        self.survivors = [
-            f for f in os.listdir(self.survivor_folder)
-            if f.lower().endswith(".png")
-        ]
-        self.items     = [
-            f for f in os.listdir(self.item_folder)
-            if f.lower().endswith(".png")
-        ]
+        # Survivor/item names, filled by _on_scanned once the background scan lands
+        self._ready    = False
+        self.survivors = ()
+        self.items     = ()
+
+        # PNG names and paths of every item's addon folder, scanned once up
+        # front and revalidated against the folder mtime when a spin starts
+        self._addon_cache  = {}
+        self._addon_paths  = {}
+        self._addon_mtimes = {}
+        self._name_cache   = {}  # file name -> display name, filled as folders are scanned
+
+        # Full paths joined once, index-aligned with the name lists above
+        self._survivor_paths = []
+        self._item_paths     = []
+        self._item_keys      = []  # addon folder names
 
         self._picked_survivor = None
         self._picked_item     = None
         self._temp_item       = None  # used during item spin
+        self._temp_item_key   = None
+        # addon folder of the item being spun/picked, bound by _bind_addons
+        self._current_addon_folder = None
+        self._current_addon_files  = ()
+        self._current_addon_paths  = ()
 
         # PerkDisplay (bottom row)
         self.pd = PerkDisplay(
@@ -58,17 +120,11 @@ class FullSurvivorDisplay(QWidget):
             hover_sound=hover_sound,
             click_sound=click_sound
         )
-        for btn in self.pd.findChildren(AnimatedButton):
-            btn.hide()
+        self.pd.spin_button.hide()
+        self.pd.back_button.hide()
 
         # Placeholder graphic
-        self.placeholder = QPixmap(
-            image_path("survivor_perks", "helpLoadingSurvivor.png")
-        ).scaled(
-            IMAGE_SIZE, IMAGE_SIZE,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        self.placeholder = image_cache.get(image_path("survivor_perks", "helpLoadingSurvivor.png"), IMAGE_SIZE)
 
         # Helper to build a cell (frame + icon + label)
         def make_cell(initial_pix=None):
@@ -80,11 +136,7 @@ class FullSurvivorDisplay(QWidget):
 
             frame = QWidget()
             frame.setFixedSize(PERK_FRAME, PERK_FRAME)
-            frame.setStyleSheet("""
-                background-color: rgba(0,0,0,150);
-                border: 2px solid #222;
-                border-radius: 10px;
-            """)
+            frame.setStyleSheet(_FRAME_QSS)
             pfl = QVBoxLayout(frame)
             pfl.setContentsMargins(0,0,0,0)
             pfl.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -100,10 +152,7 @@ class FullSurvivorDisplay(QWidget):
             txt.setFixedSize(PERK_FRAME, LABEL_HEIGHT)
             txt.setAlignment(Qt.AlignmentFlag.AlignCenter)
             txt.setWordWrap(True)
-            txt.setStyleSheet("""
-                color: white; font-size: 10pt; font-weight: bold;
-                background: transparent;
-            """)
+            txt.setStyleSheet(_LABEL_QSS)
             lay.addWidget(txt)
 
             cell.setFixedSize(PERK_FRAME, PERK_FRAME + LABEL_HEIGHT)
@@ -146,7 +195,7 @@ class FullSurvivorDisplay(QWidget):
         main.addSpacing(20)
 
         # Buttons
-        btn_spin = AnimatedButton(
+        self.spin_btn = btn_spin = AnimatedButton(
             "Spin Everything",
             hover_color="#405c94", base_color="#222", text_color="white",
             hover_sound=hover_sound, click_sound=click_sound
@@ -170,20 +219,139 @@ class FullSurvivorDisplay(QWidget):
         tip.setStyleSheet("color:#ccc;font-size:8pt;")
         main.addWidget(tip, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        # Full‑sequence timer
+        # Spin frames walk pre-shuffled index orders instead of drawing a
+        # fresh random.choice on every tick; addon orders align with addon_icons
+        self._spin_rng          = random.Random()
+        self._step_order        = ()
+        self._addon_orders      = [(), ()]
+        self._slot_order        = ()
+        self._slot_addon_orders = [(), ()]
+
+        # Full‑sequence state
         self._phase = 0
         self._cnt   = 0
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._step)
 
-        # Single‑slot timer
+        # Single‑slot state
         self._spin_type    = None
         self._spin_idx     = None
         self._spin_counter = 0
-        self._slot_timer   = QTimer(self)
-        self._slot_timer.timeout.connect(self._animate_slot_spin)
+
+        # One timer drives both channels (_step and _animate_slot_spin);
+        # a channel returns True once its spin has finished
+        self._channels = {}
+        self._tick = QTimer(self)
+        self._tick.setTimerType(Qt.TimerType.PreciseTimer)
+        self._tick.timeout.connect(self._on_tick)
+
+        # Enumerate the asset folders off the GUI thread; Spin unlocks in _on_scanned
+        self.spin_btn.setEnabled(False)
+        self._scan_signals = _ScanSignals(self)
+        self._scan_signals.scanned.connect(self._on_scanned)
+        QThreadPool.globalInstance().start(
+            _ScanTask(_scan_assets, (self.survivor_folder, self.item_folder, self.addons_root),
+                      self._scan_signals), 1
+        )
+
+    def _on_scanned(self, result):
+        if isinstance(result, OSError):
+            print(f"[ERROR] Scanning survivor assets: {result}")
+            self.portrait_txt.setText("Couldn't read the survivor images")
+            return
+        self.survivors, self.items, addons = result
+        for key, (mtime, names, paths) in addons.items():
+            self._store_addons(key, mtime, names, paths)
+        for f in self.survivors + self.items:
+            self._name_cache[f] = format_perk_name(f)
+
+        self._survivor_paths = [os.path.join(self.survivor_folder, f) for f in self.survivors]
+        self._item_paths     = [os.path.join(self.item_folder, f) for f in self.items]
+        self._item_keys      = [os.path.splitext(f)[0] for f in self.items]
+
+        paths = self._survivor_paths + self._item_paths
+        for addon_paths in self._addon_paths.values():
+            paths += addon_paths
+        image_cache.prefetch(paths, IMAGE_SIZE)
+        self._ready = True
+        self.spin_btn.setEnabled(True)
+
+    def _refresh_addons(self, key):
+        """Rescan an item's addon folder if it changed on disk since it was cached."""
+        folder = os.path.join(self.addons_root, key)
+        try:
+            mtime = os.stat(folder).st_mtime
+        except OSError:
+            mtime = None  # folder gone: the item has no addons to spin
+        if key in self._addon_mtimes:
+            if self._addon_mtimes[key] == mtime:
+                return
+            image_cache.invalidate(folder)  # changed on disk since the last scan
+        try:
+            listing = _scan_addon_folder(folder) if mtime is not None else ((), ())
+        except OSError:
+            mtime, listing = None, ((), ())
+        self._store_addons(key, mtime, *listing)
+
+    def _store_addons(self, key, mtime, names, paths):
+        """Cache one addon folder's listing and the display names of its files."""
+        self._addon_mtimes[key] = mtime
+        self._addon_cache[key]  = names
+        self._addon_paths[key]  = paths
+        for name in names:
+            if name not in self._name_cache:
+                self._name_cache[name] = format_perk_name(name)
+
+    def _bind_addons(self, key):
+        """Make `key`'s addon folder the one spins and rerolls draw from."""
+        self._refresh_addons(key)
+        self._current_addon_folder = os.path.join(self.addons_root, key)
+        self._current_addon_files  = self._addon_cache[key]
+        self._current_addon_paths  = self._addon_paths[key]
+
+    def _addon_frame(self, i):
+        """Spin-frame pixmap for the bound folder's `i`th addon."""
+        # straight from the shared cache each tick: a miss there hands back a
+        # stand-in frame, which must not be kept in place of the real icon
+        return image_cache.get(self._current_addon_paths[i], IMAGE_SIZE, smooth=False, fallback=self.placeholder)
+
+    def _prefetch_item_addons(self, i):
+        # the item spin's order is fixed up front, so the item it will land
+        # on is known and its addons can decode while it is still spinning
+        image_cache.prefetch(self._addon_paths.get(self._item_keys[i], ()), IMAGE_SIZE)
+
+    def _spin_order(self, n):
+        """Shuffled indices into `n` files, cycled through by one spin."""
+        return self._spin_rng.sample(range(n), min(n, SPIN_STEPS))
+
+    def _run(self, channel):
+        """Add a spin handler to the shared timer, starting it if idle."""
+        self._channels[channel] = None
+        if not self._tick.isActive():
+            self._tick.start(SPIN_INTERVAL)
+
+    def _on_tick(self):
+        for channel in list(self._channels):
+            if channel():
+                self._channels.pop(channel, None)
+        if not self._channels:
+            self._tick.stop()
+
+    # — Pause while off screen —
+    def hideEvent(self, event):
+        # the main window's page stack keeps this view alive while hidden;
+        # the embedded PerkDisplay is never shown itself, so pause it here
+        self._tick.stop()
+        self.pd._tick.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        for sub in (self, self.pd):
+            if sub._channels:
+                sub._tick.start(SPIN_INTERVAL)
 
     def _start(self):
+        if not self._ready:
+            return
         # Reset icons to placeholders before animating
         self._phase, self._cnt = 1, 0
         self.portrait_icon.setPixmap(self.placeholder)
@@ -191,176 +359,191 @@ class FullSurvivorDisplay(QWidget):
         for ico, txt in zip(self.addon_icons, self.addon_txts):
             ico.setPixmap(self.placeholder)
             txt.clear()
-        self.pd._timer.stop()
-        self._timer.start(SPIN_INTERVAL)
+        self.pd._channels.pop(self.pd._animate_spin, None)
+        self._step_order = self._spin_order(len(self.survivors))
+        self._run(self._step)
 
-    def _step(self):
+    def _step(self, _steps=SPIN_STEPS):
         self._cnt += 1
         # Phase 1: portrait
         if self._phase == 1:
-            choice = random.choice(self.survivors)
-            pix = QPixmap(os.path.join(self.survivor_folder, choice))\
-                  .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.portrait_icon.setPixmap(pix)
-            if self._cnt >= SPIN_STEPS:
+            i = self._step_order[self._cnt % len(self._step_order)]
+            self.portrait_icon.setPixmap(image_cache.get(self._survivor_paths[i], IMAGE_SIZE, smooth=False, fallback=self.placeholder))
+            if self._cnt >= _steps:
+                choice = self.survivors[i]
                 self._picked_survivor = choice
-                self.portrait_txt.setText(format_perk_name(choice))
+                self.portrait_icon.setPixmap(image_cache.get(self._survivor_paths[i], IMAGE_SIZE))
+                self.portrait_txt.setText(self._name_cache[choice])
+                self._step_order = self._spin_order(len(self.items))
+                self._prefetch_item_addons(self._step_order[_steps % len(self._step_order)])
                 self._phase, self._cnt = 2, 0
 
         # Phase 2: item (and reset addons)
         elif self._phase == 2:
-            choice = random.choice(self.items)
-            pix = QPixmap(os.path.join(self.item_folder, choice))\
-                  .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.item_icon.setPixmap(pix)
-            if self._cnt >= SPIN_STEPS:
+            i = self._step_order[self._cnt % len(self._step_order)]
+            self.item_icon.setPixmap(image_cache.get(self._item_paths[i], IMAGE_SIZE, smooth=False, fallback=self.placeholder))
+            if self._cnt >= _steps:
+                choice = self.items[i]
                 self._temp_item = choice
+                self._temp_item_key = self._item_keys[i]
+                self.item_icon.setPixmap(image_cache.get(self._item_paths[i], IMAGE_SIZE))
                 # make individual‐addon rerolls work
-                self._picked_item = os.path.splitext(choice)[0]
-                self.item_txt.setText(format_perk_name(choice))
+                self._picked_item = self._temp_item_key
+                self.item_txt.setText(self._name_cache[choice])
                 # reset addons to placeholder
                 for ico, txt in zip(self.addon_icons, self.addon_txts):
                     ico.setPixmap(self.placeholder)
                     txt.clear()
-                self._phase, self._cnt = 3, 0
+                self._bind_addons(self._picked_item)
+                n = len(self._current_addon_files)
+                self._addon_orders = [self._spin_order(n) for _ in self.addon_icons]
+                # an item without addons goes straight on to the perks
+                self._phase, self._cnt = (3 if n else 4), 0
 
         # Phase 3: addons
         elif self._phase == 3:
-            folder = os.path.join(self.addons_root, os.path.splitext(self._temp_item)[0])
-            files  = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
-            for ico in self.addon_icons:
-                fn = random.choice(files)
-                pix = QPixmap(os.path.join(folder, fn))\
-                      .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                ico.setPixmap(pix)
-            if self._cnt >= SPIN_STEPS:
-                picks = random.sample(files, min(2, len(files)))
+            files  = self._current_addon_files
+            # one addon icon changes per tick, alternating between the two
+            k, step = self._cnt & 1, self._cnt >> 1
+            order   = self._addon_orders[k]
+            self.addon_icons[k].setPixmap(self._addon_frame(order[step % len(order)]))
+            if self._cnt >= _steps:
+                picks = [files[i] for i in pick_two(self._spin_rng.randrange, len(files))]
                 # remember them so they stay unique
                 self._picked_addons = picks
                 for ico, txt, fn in zip(self.addon_icons, self.addon_txts, picks):
-                    pix = QPixmap(os.path.join(folder, fn)) \
-                        .scaled(IMAGE_SIZE, IMAGE_SIZE,
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation)
+                    pix = image_cache.get(os.path.join(self._current_addon_folder, fn), IMAGE_SIZE)
                     ico.setPixmap(pix)
-                    txt.setText(format_perk_name(fn))
+                    txt.setText(self._name_cache[fn])
                 self._phase, self._cnt = 4, 0
 
         # Phase 4: perks
         elif self._phase == 4:
             self.pd._start_spin()
-            self._timer.stop()
+            return True
+        return False
 
     # — Single‑slot reroll animations —
 
     def _start_survivor_spin(self):
+        if not self._ready:
+            return
         self._spin_type    = "survivor"
         self._spin_counter = 0
-        self._slot_timer.start(SPIN_INTERVAL)
+        self._slot_order   = self._spin_order(len(self.survivors))
+        self._run(self._animate_slot_spin)
 
     def _start_item_spin(self):
+        if not self._ready:
+            return
         # reset addons immediately
         for ico, txt in zip(self.addon_icons, self.addon_txts):
             ico.setPixmap(self.placeholder)
             txt.clear()
         self._spin_type    = "item_sequence"
         self._spin_counter = 0
-        self._slot_timer.start(SPIN_INTERVAL)
+        self._slot_order   = self._spin_order(len(self.items))
+        self._prefetch_item_addons(self._slot_order[SPIN_STEPS % len(self._slot_order)])
+        self._run(self._animate_slot_spin)
 
     def _start_addon_spin(self, idx):
+        if self._picked_item:
+            self._bind_addons(self._picked_item)
+            if not self._current_addon_files:
+                return
+            self._slot_order = self._spin_order(len(self._current_addon_files))
         self._spin_type    = "addon"
         self._spin_idx     = idx
         self._spin_counter = 0
-        self._slot_timer.start(SPIN_INTERVAL)
+        self._run(self._animate_slot_spin)
 
-    def _animate_slot_spin(self):
+    def _animate_slot_spin(self, _steps=SPIN_STEPS):
         self._spin_counter += 1
 
         if self._spin_type == "survivor":
-            choice = random.choice(self.survivors)
-            pix = QPixmap(os.path.join(self.survivor_folder, choice))\
-                  .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.portrait_icon.setPixmap(pix)
-            if self._spin_counter >= SPIN_STEPS:
-                self._slot_timer.stop()
+            i = self._slot_order[self._spin_counter % len(self._slot_order)]
+            self.portrait_icon.setPixmap(image_cache.get(self._survivor_paths[i], IMAGE_SIZE, smooth=False, fallback=self.placeholder))
+            if self._spin_counter >= _steps:
                 self._reroll_survivor()
+                return True
 
         elif self._spin_type == "item_sequence":
             # first SPIN_STEPS ticks animate the item
-            half = SPIN_STEPS
+            half = _steps
             if self._spin_counter <= half:
-                choice = random.choice(self.items)
-                pix = QPixmap(os.path.join(self.item_folder, choice))\
-                      .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.item_icon.setPixmap(pix)
+                i = self._slot_order[self._spin_counter % len(self._slot_order)]
+                self.item_icon.setPixmap(image_cache.get(self._item_paths[i], IMAGE_SIZE, smooth=False, fallback=self.placeholder))
                 if self._spin_counter == half:
+                    choice = self.items[i]
                     self._temp_item = choice
-                    self.item_txt.setText(format_perk_name(choice))
+                    self._temp_item_key = self._item_keys[i]
+                    self.item_icon.setPixmap(image_cache.get(self._item_paths[i], IMAGE_SIZE))
+                    self.item_txt.setText(self._name_cache[choice])
+                    self._bind_addons(self._temp_item_key)
+                    n = len(self._current_addon_files)
+                    if not n:  # no addons to animate: settle on the item now
+                        self._picked_item = self._temp_item_key
+                        self._reroll_item()
+                        return True
+                    self._slot_addon_orders = [self._spin_order(n) for _ in self.addon_icons]
             # next SPIN_STEPS ticks animate the two addons
             elif self._spin_counter <= 2*half:
-                folder = os.path.join(self.addons_root, os.path.splitext(self._temp_item)[0])
-                files  = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
-                for ico in self.addon_icons:
-                    fn = random.choice(files)
-                    pix = QPixmap(os.path.join(folder, fn))\
-                          .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    ico.setPixmap(pix)
+                k, step = self._spin_counter & 1, self._spin_counter >> 1
+                order   = self._slot_addon_orders[k]
+                self.addon_icons[k].setPixmap(self._addon_frame(order[step % len(order)]))
                 if self._spin_counter == 2*half:
-                    self._slot_timer.stop()
                     # finalize item + addons
-                    self._picked_item = os.path.splitext(self._temp_item)[0]
+                    self._picked_item = self._temp_item_key
                     self._reroll_item()
-
+                    return True
 
         elif self._spin_type == "addon":
 
             # if no item has ever been picked, abort
             if not self._picked_item:
-                self._slot_timer.stop()
-                return
-            folder = os.path.join(self.addons_root, self._picked_item)
-            files = [f for f in os.listdir(folder) if f.lower().endswith('.png')]
-            fn = random.choice(files)
-            pix = QPixmap(os.path.join(folder, fn))\
-                    .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation)
-
+                return True
+            pix = self._addon_frame(self._slot_order[self._spin_counter % len(self._slot_order)])
             self.addon_icons[self._spin_idx].setPixmap(pix)
-            if self._spin_counter >= SPIN_STEPS:
-                self._slot_timer.stop()
+            if self._spin_counter >= _steps:
                 self._reroll_addon(self._spin_idx)
+                return True
+        return False
 
     # — Reroll helpers —
 
     def _reroll_survivor(self):
-        pick = random.choice(self.survivors)
-        pix  = QPixmap(os.path.join(self.survivor_folder, pick))\
-               .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.portrait_icon.setPixmap(pix)
-        self.portrait_txt.setText(format_perk_name(pick))
+        i    = self._spin_rng.randrange(len(self.survivors))
+        pick = self.survivors[i]
+        self.portrait_icon.setPixmap(image_cache.get(self._survivor_paths[i], IMAGE_SIZE))
+        self.portrait_txt.setText(self._name_cache[pick])
         self._picked_survivor = pick
 
     def _reroll_item(self):
-        pick = self._temp_item or random.choice(self.items)
-        pix  = QPixmap(os.path.join(self.item_folder, pick))\
-               .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.item_icon.setPixmap(pix)
-        self.item_txt.setText(format_perk_name(pick))
-        self._picked_item = os.path.splitext(pick)[0]
+        if self._temp_item:
+            pick = self._temp_item
+            key  = self._temp_item_key
+            path = os.path.join(self.item_folder, pick)
+        else:
+            i    = self._spin_rng.randrange(len(self.items))
+            pick = self.items[i]
+            key  = self._item_keys[i]
+            path = self._item_paths[i]
+        self.item_icon.setPixmap(image_cache.get(path, IMAGE_SIZE))
+        self.item_txt.setText(self._name_cache[pick])
+        self._picked_item = key
         # cascade to both addons
         for i in range(2):
             self._reroll_addon(i)
 
     def _reroll_addon(self, idx):
-        folder = os.path.join(self.addons_root, self._picked_item)
-        files  = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
+        self._bind_addons(self._picked_item)
+        files  = self._current_addon_files
+        paths  = self._current_addon_paths
+        if not files:
+            return
         # never pick the same as the *other* addon
-        other_idx = 1 - idx
-        other_fn = self._picked_addons[other_idx]
-        pool = [f for f in files if f != other_fn] or files
-        fn = random.choice(pool)
+        i  = pick_other(self._spin_rng.randrange, files, self._picked_addons[1 - idx])
+        fn = files[i]
         self._picked_addons[idx] = fn
-        pix    = QPixmap(os.path.join(folder, fn))\
-                 .scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.addon_icons[idx].setPixmap(pix)
-        self.addon_txts[idx].setText(format_perk_name(fn))
+        self.addon_icons[idx].setPixmap(image_cache.get(paths[i], IMAGE_SIZE))
+        self.addon_txts[idx].setText(self._name_cache[fn])
@@ -1,40 +1,112 @@
 import os
 import random
+import time
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-from PyQt6.QtCore    import Qt, QTimer
-from PyQt6.QtGui     import QPixmap
+from PyQt6.QtCore    import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
-from widgets import AnimatedButton, ClickableLabel
-from utils    import format_perk_name
+from widgets     import AnimatedButton, ClickableLabel
+from utils       import format_perk_name, pick_two, pick_other, spin_step
+from image_cache import image_cache
 
 SPIN_INTERVAL = 100
 SPIN_STEPS    = 20
+PORTRAIT_SIZE = 220
+ADDON_SIZE    = 110
+
+# Hot-path lookups bound once at import
+_KEEP_AR = Qt.AspectRatioMode.KeepAspectRatio
+_SMOOTH  = Qt.TransformationMode.SmoothTransformation
+
+# Stylesheets shared by the portrait and addon cells
+_FRAME_QSS = """
+    QFrame { background-color: rgba(0,0,0,150);
+             border: 2px solid #222;
+             border-radius: 10px; }
+"""
+_ADDON_NAME_QSS = """
+    QLabel { color: white; font-size:10pt; font-weight:bold; background: transparent; }
+"""
+
+_BASE = os.path.dirname(os.path.abspath(__file__))
 
 def image_path(*parts):
-    base = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base, "images", *parts)
+    return os.path.join(_BASE, "images", *parts)
+
+def _scan_assets(killer_dir, addons_root):
+    """Killer portrait names, each killer's addon names and folder mtime, and
+    every addon path; runs on the thread pool."""
+    addons, mtimes = {}, {}
+    with os.scandir(addons_root) as it:
+        for entry in it:
+            if entry.is_dir():
+                addons[entry.name] = image_cache.listing(entry.path)
+                mtimes[entry.name] = entry.stat().st_mtime
+    return image_cache.listing(killer_dir), addons, mtimes, _join_addons(addons_root, addons)
+
+def _join_addons(addons_root, addons):
+    """Full path of every addon PNG across all killers."""
+    return [os.path.join(addons_root, key, fn) for key, files in addons.items() for fn in files]
+
+class _ScanSignals(QObject):
+    scanned = pyqtSignal(object)
+
+class _ScanTask(QRunnable):
+    """Enumerate the asset folders on a worker thread, off the first paint."""
+
+    def __init__(self, scan, args, signals):
+        super().__init__()
+        self.scan    = scan
+        self.args    = args
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.scan(*self.args)
+        except OSError as e:
+            result = e  # missing or unreadable folder; _on_scanned reports it
+        try:
+            self.signals.scanned.emit(result)
+        except RuntimeError:
+            pass  # display was closed before the scan finished
 
 class KillerDisplay(QWidget):
+    ready = pyqtSignal()  # asset folders scanned, spins can start
+
+    # Scan result shared by every instance (the standalone page and the one
+    # FullDisplay embeds), so only the first display enumerates the folders
+    _scanned = None
+
     def __init__(self, back_callback, hover_sound=None, click_sound=None):
         super().__init__()
         self.back_cb     = back_callback
         self.hover_sound = hover_sound
         self.click_sound = click_sound
         self._addon_files = [None, None]
+        self._killer_key  = ""  # addon folder of the revealed killer
 
         # ─── Data ────────────────────────────────────────────────────────
         self.killer_dir   = image_path("killers")
         self.addons_root  = image_path("killer_addons")
-        self.killer_files = [
-            f for f in os.listdir(self.killer_dir)
-            if f.lower().endswith(".png")
-        ]
+
+        # Filled by _on_scanned once the background scan lands: portrait
+        # names, addon PNGs and folder mtime per killer, and every addon path
+        # for the addon spin. The addon containers are the shared scan result's
+        # own, so refresh_addons updates every display at once.
+        self._ready            = False
+        self.killer_files      = ()
+        self._killer_paths     = ()  # full path of each killer_files entry
+        self._addons_by_killer = {}
+        self._addon_mtimes     = {}
+        self._addon_keys       = {}  # casefolded folder name -> folder name on disk
+        self._all_addons       = []
+        self._rng = random.Random()
+
+        # Killer display names formatted once per file
+        self._name_cache = {}
 
         # placeholder graphic
-        self.placeholder = QPixmap(image_path("killer_perks", "helpLoadingKiller.png")) \
-            .scaled(220, 220,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation)
+        self.placeholder = image_cache.get(image_path("killer_perks", "helpLoadingKiller.png"), PORTRAIT_SIZE)
+        self._placeholder_small = self.placeholder.scaled(ADDON_SIZE, ADDON_SIZE, _KEEP_AR, _SMOOTH)
 
         # ─── UI ───────────────────────────────────────────────────────────
         self.setStyleSheet("background: transparent;")
@@ -54,11 +126,7 @@ class KillerDisplay(QWidget):
 
         frame = QFrame()
         frame.setFixedSize(260,260)
-        frame.setStyleSheet("""
-            QFrame { background-color: rgba(0,0,0,150);
-                     border: 2px solid #222;
-                     border-radius: 10px; }
-        """)
+        frame.setStyleSheet(_FRAME_QSS)
         fl = QVBoxLayout(frame)
         fl.setContentsMargins(0,0,0,0)
         fl.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -107,20 +175,14 @@ class KillerDisplay(QWidget):
 
             af = QFrame()
             af.setFixedSize(140,140)
-            af.setStyleSheet("""
-                QFrame { background-color: rgba(0,0,0,150);
-                         border: 2px solid #222;
-                         border-radius: 10px; }
-            """)
+            af.setStyleSheet(_FRAME_QSS)
             afl = QVBoxLayout(af)
             afl.setContentsMargins(0,0,0,0)
             afl.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
             ico = ClickableLabel()
             ico.setFixedSize(110,110)
-            ico.setPixmap(self.placeholder.scaled(
-                110,110,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation
-            ))
+            ico.setPixmap(self._placeholder_small)
             ico.setAlignment(Qt.AlignmentFlag.AlignCenter)
             ico.setToolTip("Click to reroll this addon (spins first)")
             ico.clicked.connect(lambda *args, i=idx: self._start_single_addon(i))
@@ -130,9 +192,7 @@ class KillerDisplay(QWidget):
             name.setFixedSize(140,40)
             name.setAlignment(Qt.AlignmentFlag.AlignCenter)
             name.setWordWrap(True)
-            name.setStyleSheet("""
-                QLabel { color: white; font-size:10pt; font-weight:bold; background: transparent; }
-            """)
+            name.setStyleSheet(_ADDON_NAME_QSS)
 
             cl.addWidget(af)
             cl.addSpacing(5)
@@ -149,163 +209,249 @@ class KillerDisplay(QWidget):
         root.addSpacing(30)
 
         # Spin / Back
-        spin_btn = AnimatedButton("Spin", hover_color="#982c1c", base_color="#222", text_color="white",
-                                  hover_sound=self.hover_sound, click_sound=self.click_sound)
-        spin_btn.setFixedSize(220,50)
-        spin_btn.clicked.connect(self._start_portrait)
-        root.addWidget(spin_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.spin_btn = AnimatedButton("Spin", hover_color="#982c1c", base_color="#222", text_color="white",
+                                       hover_sound=self.hover_sound, click_sound=self.click_sound)
+        self.spin_btn.setFixedSize(220,50)
+        self.spin_btn.clicked.connect(self._start_portrait)
+        root.addWidget(self.spin_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         root.addSpacing(8)
 
-        back_btn = AnimatedButton("Back", hover_color="#555", base_color="#111", text_color="white",
-                                  hover_sound=self.hover_sound, click_sound=self.click_sound)
-        back_btn.setFixedSize(150,50)
-        back_btn.clicked.connect(self.back_cb)
-        root.addWidget(back_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.back_btn = AnimatedButton("Back", hover_color="#555", base_color="#111", text_color="white",
+                                       hover_sound=self.hover_sound, click_sound=self.click_sound)
+        self.back_btn.setFixedSize(150,50)
+        self.back_btn.clicked.connect(self.back_cb)
+        root.addWidget(self.back_btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
         tip = QLabel("Tip: click any icon above to reroll it individually.", self)
         tip.setStyleSheet("color: #ccc; font-size: 8pt;")
         root.addWidget(tip, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        # ─── Timers & Counters ─────────────────────────────────────────
-        # Full‑sequence
-        self._portrait_counter = 0
-        self._addon_counter    = 0
-        self.portrait_timer    = QTimer(self)
-        self.portrait_timer.timeout.connect(self._animate_portrait)
-        self.addon_timer       = QTimer(self)
-        self.addon_timer.timeout.connect(self._animate_addons)
+        # ─── Timer & Spin clocks ───────────────────────────────────────
+        # Each spin keeps the time.monotonic() it started at and works out
+        # its step from the elapsed time, so a late tick doesn't lengthen it.
+        # Full‑sequence; the steps are read by FullDisplay
+        self._portrait_start = 0.0
+        self._portrait_step  = 0
+        self._addon_start    = 0.0
+        self._addon_step     = 0
 
         # Single‑addon
-        self._single_addon_counter = 0
+        self._single_addon_start   = 0.0
         self._single_addon_idx     = None
-        self._single_addon_timer   = QTimer(self)
-        self._single_addon_timer.timeout.connect(self._animate_single_addon)
+        self._single_addon_paths   = []    # bound when the spin starts
+        self._single_addon_label   = None
 
         # Single‑portrait
-        self._single_portrait_counter = 0
-        self._single_portrait_timer   = QTimer(self)
-        self._single_portrait_timer.timeout.connect(self._animate_single_portrait)
+        self._single_portrait_start = 0.0
+
+        # One timer drives every running spin; each channel is an _animate_*
+        # handler that returns True once its spin has finished
+        self._channels = {}
+        self._tick = QTimer(self)
+        self._tick.setTimerType(Qt.TimerType.PreciseTimer)
+        self._tick.timeout.connect(self._on_tick)
+
+        if KillerDisplay._scanned is not None:
+            self._on_scanned(KillerDisplay._scanned)
+            return
+
+        # Enumerate the asset folders off the GUI thread; Spin unlocks in _on_scanned
+        self.spin_btn.setEnabled(False)
+        self._scan_signals = _ScanSignals(self)
+        self._scan_signals.scanned.connect(self._on_scanned)
+        QThreadPool.globalInstance().start(
+            _ScanTask(_scan_assets, (self.killer_dir, self.addons_root), self._scan_signals), 1
+        )
+
+    def _on_scanned(self, result):
+        if isinstance(result, OSError):
+            print(f"[ERROR] Scanning killer assets: {result}")
+            self.name_label.setText("Couldn't read the killer images")
+            return
+        KillerDisplay._scanned = result
+        self.killer_files, self._addons_by_killer, self._addon_mtimes, self._all_addons = result
+        self._addon_keys = {key.casefold(): key for key in self._addons_by_killer}
+        self._killer_paths = tuple(os.path.join(self.killer_dir, f) for f in self.killer_files)
+        self._name_cache = {f: format_perk_name(f) for f in self.killer_files}
+
+        image_cache.prefetch(self._killer_paths, PORTRAIT_SIZE)
+        image_cache.prefetch(self._all_addons, ADDON_SIZE)
+        self._ready = True
+        self.spin_btn.setEnabled(True)
+        self.ready.emit()
+
+    def _addon_key(self, killer_file):
+        """Addon folder of a killer, matched to its display name regardless of case."""
+        name = self._name_cache[killer_file].replace(" ", "").casefold()
+        return self._addon_keys.get(name, "")
+
+    def _addon_paths(self, key):
+        """Full paths of one killer's addon PNGs."""
+        folder = os.path.join(self.addons_root, key)
+        return [os.path.join(folder, fn) for fn in self._addons_by_killer.get(key, ())]
+
+    def refresh_addons(self, key):
+        """Rescan a killer's addon folder if it changed on disk since it was scanned."""
+        folder = os.path.join(self.addons_root, key)
+        try:
+            mtime = os.stat(folder).st_mtime
+            if self._addon_mtimes.get(key) == mtime:
+                return
+            image_cache.invalidate(folder)
+            files = image_cache.listing(folder)
+        except OSError:  # folder gone: nothing left to spin or pick
+            if not self._addons_by_killer.get(key):
+                return
+            mtime, files = None, ()
+        self._addon_mtimes[key]     = mtime
+        self._addons_by_killer[key] = files
+        self._all_addons[:] = _join_addons(self.addons_root, self._addons_by_killer)
+        image_cache.prefetch(self._addon_paths(key), ADDON_SIZE)
+
+    def _prefetch_addons(self):
+        # the picked killer's addons are about to be revealed
+        if self._killer_key:
+            self.refresh_addons(self._killer_key)
+        image_cache.prefetch(self._addon_paths(self._killer_key), ADDON_SIZE)
+
+    # ─── Shared timer ────────────────────────────────────────────────
+    def _run(self, channel):
+        """Add a spin handler to the shared timer, starting it if idle."""
+        self._channels[channel] = None
+        if not self._tick.isActive():
+            self._tick.start(SPIN_INTERVAL)
+
+    def _on_tick(self):
+        for channel in list(self._channels):
+            if channel():
+                self._channels.pop(channel, None)
+        if not self._channels:
+            self._tick.stop()
+
+    # ─── Pause while off screen ─────────────────────────────────────
+    def hideEvent(self, event):
+        # the main window's page stack keeps this view alive while hidden
+        self._tick.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._channels:
+            self._tick.start(SPIN_INTERVAL)
 
     # ─── Full‑sequence handlers ───────────────────────────────────────
     def _start_portrait(self):
-        self._portrait_counter = 0
+        if not self._ready:
+            return
+        self._portrait_start = time.monotonic()
+        self._portrait_step  = 0
         self.name_label.clear()
+        self._killer_key = ""
         for icon, lbl in zip(self.addon_labels, self.addon_name_labels):
-            icon.setPixmap(self.placeholder.scaled(110,110,
-                Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation))
+            icon.setPixmap(self._placeholder_small)
             lbl.clear()
-        self.portrait_timer.start(SPIN_INTERVAL)
-
-    def _animate_portrait(self):
-        self._portrait_counter += 1
-        pick = random.choice(self.killer_files)
-        self.portrait_label.setPixmap(
-            QPixmap(os.path.join(self.killer_dir, pick))
-            .scaled(220,220,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-        )
-        if self._portrait_counter > SPIN_STEPS:
-            self.portrait_timer.stop()
-            self.name_label.setText(format_perk_name(pick))
+        self._run(self._animate_portrait)
+
+    # Spin handlers take module-level lookups as default arguments, so a
+    # tick resolves them as fast locals instead of global/attribute chains
+    def _animate_portrait(self, _get=image_cache.get, _steps=SPIN_STEPS):
+        self._portrait_step = spin_step(self._portrait_start, SPIN_INTERVAL)
+        paths = self._killer_paths
+        i     = self._rng.randrange(len(paths))
+        self.portrait_label.setPixmap(_get(paths[i], PORTRAIT_SIZE, smooth=False, fallback=self.placeholder))
+        if self._portrait_step > _steps:
+            self.portrait_label.setPixmap(_get(paths[i], PORTRAIT_SIZE))
+            self.name_label.setText(self._name_cache[self.killer_files[i]])
+            self._killer_key = self._addon_key(self.killer_files[i])
+            self._prefetch_addons()
             self._start_addons()
+            return True
+        return False
 
     def _start_addons(self):
-        self._addon_counter = 0
-        self.addon_timer.start(SPIN_INTERVAL)
-
-    def _animate_addons(self):
-        self._addon_counter += 1
-        all_addons = []
-        for sub in os.listdir(self.addons_root):
-            fld = os.path.join(self.addons_root, sub)
-            if os.path.isdir(fld):
-                for fn in os.listdir(fld):
-                    if fn.lower().endswith(".png"):
-                        all_addons.append(os.path.join(fld, fn))
-
-        for icon in self.addon_labels:
-            icon.setPixmap(
-                QPixmap(random.choice(all_addons)).scaled(110,110,
-                    Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-            )
-
-        if self._addon_counter > SPIN_STEPS:
-            self.addon_timer.stop()
+        self._addon_start = time.monotonic()
+        self._addon_step  = 0
+        self._run(self._animate_addons)
+
+    def _animate_addons(self, _get=image_cache.get, _steps=SPIN_STEPS):
+        self._addon_step = spin_step(self._addon_start, SPIN_INTERVAL)
+        randrange = self._rng.randrange
+        paths     = self._all_addons
+        n         = len(paths)
+        first, second = self.addon_labels
+        # exactly two addon slots: draw each directly, nothing allocated per tick
+        first.setPixmap(_get(paths[randrange(n)], ADDON_SIZE, smooth=False, fallback=self._placeholder_small))
+        second.setPixmap(_get(paths[randrange(n)], ADDON_SIZE, smooth=False, fallback=self._placeholder_small))
+
+        if self._addon_step > _steps:
             self._reveal_addons()
+            return True
+        return False
 
     def _reveal_addons(self):
-        key = self.name_label.text().replace(" ", "")
-        folder = os.path.join(self.addons_root, key)
-        if not os.path.isdir(folder):
+        key = self._killer_key
+        files = self._addons_by_killer.get(key, ())
+        if not files:
             return
-        files = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
-        picks = random.sample(files, min(2, len(files)))
+        folder = os.path.join(self.addons_root, key)
+        picks = [files[i] for i in pick_two(self._rng.randrange, len(files))]
         self._addon_files = picks
         for icon, name_lbl, fn in zip(self.addon_labels, self.addon_name_labels, picks):
-            path = os.path.join(folder, fn)
-            icon.setPixmap(
-                QPixmap(path).scaled(110,110,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-            )
+            icon.setPixmap(image_cache.get(os.path.join(folder, fn), ADDON_SIZE))
             name_lbl.setText(format_perk_name(fn))
 
     # ─── Single‑slot addon spin ──────────────────────────────────────
     def _start_single_addon(self, idx):
-        if not self.name_label.text():
+        if not self._killer_key:
             return
-        self._single_addon_idx     = idx
-        self._single_addon_counter = 0
-        self._single_addon_timer.start(SPIN_INTERVAL)
-
-    def _animate_single_addon(self):
-        self._single_addon_counter += 1
-        key = self.name_label.text().replace(" ", "")
-        folder = os.path.join(self.addons_root, key)
-        if not os.path.isdir(folder):
-            self._single_addon_timer.stop()
+        self.refresh_addons(self._killer_key)
+        paths = self._addon_paths(self._killer_key)
+        if not paths:
             return
-        files = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
+        self._single_addon_idx     = idx
+        self._single_addon_paths   = paths
+        self._single_addon_label   = self.addon_labels[idx]
+        self._single_addon_start   = time.monotonic()
+        self._run(self._animate_single_addon)
 
-        icon = self.addon_labels[self._single_addon_idx]
-        icon.setPixmap(
-            QPixmap(os.path.join(folder, random.choice(files))).scaled(
-                110,110,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation
-            )
-        )
+    def _animate_single_addon(self, _get=image_cache.get, _steps=SPIN_STEPS):
+        paths = self._single_addon_paths
+        self._single_addon_label.setPixmap(_get(paths[self._rng.randrange(len(paths))], ADDON_SIZE, smooth=False, fallback=self._placeholder_small))
 
-        if self._single_addon_counter > SPIN_STEPS:
-            self._single_addon_timer.stop()
+        if spin_step(self._single_addon_start, SPIN_INTERVAL) > _steps:
             self._reroll_addon(self._single_addon_idx)
+            return True
+        return False
 
     # ─── Single‑slot portrait spin + cascade ─────────────────────────
     def _start_single_portrait(self):
-        self._single_portrait_counter = 0
-        self._single_portrait_timer.start(SPIN_INTERVAL)
-
-    def _animate_single_portrait(self):
-        self._single_portrait_counter += 1
-        pick = random.choice(self.killer_files)
-        self.portrait_label.setPixmap(
-            QPixmap(os.path.join(self.killer_dir, pick))
-            .scaled(220,220,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-        )
-        if self._single_portrait_counter > SPIN_STEPS:
-            self._single_portrait_timer.stop()
-            self.name_label.setText(format_perk_name(pick))
+        if not self._ready:
+            return
+        self._single_portrait_start = time.monotonic()
+        self._run(self._animate_single_portrait)
+
+    def _animate_single_portrait(self, _get=image_cache.get, _steps=SPIN_STEPS):
+        paths = self._killer_paths
+        i     = self._rng.randrange(len(paths))
+        self.portrait_label.setPixmap(_get(paths[i], PORTRAIT_SIZE, smooth=False, fallback=self.placeholder))
+        if spin_step(self._single_portrait_start, SPIN_INTERVAL) > _steps:
+            self.portrait_label.setPixmap(_get(paths[i], PORTRAIT_SIZE))
+            self.name_label.setText(self._name_cache[self.killer_files[i]])
+            self._killer_key = self._addon_key(self.killer_files[i])
+            self._prefetch_addons()
             self._start_addons()
+            return True
+        return False
 
     # ─── Helper (used by full‑sequence and single‑slot) ─────────────
     def _reroll_addon(self, idx):
-        key = self.name_label.text().replace(" ", "")
-        folder = os.path.join(self.addons_root, key)
-        if not os.path.isdir(folder):
+        key = self._killer_key
+        files = self._addons_by_killer.get(key, ())
+        if not files:
             return
-        files = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
-        other = self._addon_files[1-idx]
-        pool = [f for f in files if f != other] or files
-        fn = random.choice(pool)
+        folder = os.path.join(self.addons_root, key)
+        fn = files[pick_other(self._rng.randrange, files, self._addon_files[1-idx])]
         self._addon_files[idx] = fn
 
-        path = os.path.join(folder, fn)
-        self.addon_labels[idx].setPixmap(
-            QPixmap(path).scaled(110,110,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-        )
+        self.addon_labels[idx].setPixmap(image_cache.get(os.path.join(folder, fn), ADDON_SIZE))
         self.addon_name_labels[idx].setText(format_perk_name(fn))
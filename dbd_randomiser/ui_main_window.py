@@ -1,13 +1,12 @@
 import os
-import pygame
-from PyQt6.QtWidgets import QMainWindow, QWidget, QLabel, QVBoxLayout, QPushButton
+from PyQt6.QtWidgets import QMainWindow, QWidget, QLabel, QVBoxLayout, QPushButton, QStackedWidget
 from PyQt6.QtGui    import QMovie, QPixmap, QIcon
-from PyQt6.QtCore   import Qt, QTimer, QSize
+from PyQt6.QtCore   import Qt, QTimer, QSize, QEvent
 
-from ui_perk_display             import PerkDisplay
+from ui_perk_display             import PerkDisplay, IMAGE_SIZE as PERK_SIZE
 from widgets                     import AnimatedButton
-from ui_killer_randomiser        import KillerDisplay
-from ui_full_killer_randomiser   import FullDisplay  # renamed
+from image_cache                 import image_cache
+from ui_killer_randomiser        import KillerDisplay, image_path, PORTRAIT_SIZE, ADDON_SIZE
 
 # ─── Constants ─────────────────────────────────────────────────────────────
 WINDOW_WIDTH  = 1000
@@ -21,6 +20,22 @@ THEME_MUSIC  = "media/dbdtheme.mp3"
 SFX_HOVER    = "media/buttonhover.mp3"
 SFX_CLICK    = "media/buttonselect.mp3"
 DEFAULT_VOL  = 0.1
+MIXER_BUFFER = 2048  # samples; latency doesn't matter here, underrun clicks do
+
+# Absolute, like the paths the other views use, so a perk shown on two
+# pages maps to one "path@size" cache key
+KILLER_PERKS   = image_path("killer_perks")
+SURVIVOR_PERKS = image_path("survivor_perks")
+
+class _ChannelSound:
+    """Plays one Sound on a channel reserved for it, so the mixer never searches for a free voice."""
+
+    def __init__(self, sound, channel):
+        self.sound   = sound
+        self.channel = channel
+
+    def play(self):
+        self.channel.play(self.sound)
 
 class MainWindow(QMainWindow):
     """Primary window: background, audio, and menu navigation."""
@@ -31,14 +46,19 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, WINDOW_WIDTH, WINDOW_HEIGHT)
 
         # restore these methods so _setup_background actually exists:
+        self._on_menu = True  # fog only animates behind the menus
         self._setup_background()
-        self._setup_audio()
+        self._prefetch_assets()
+        self.sfx_hover = self.sfx_click = None  # set by _load_sounds
         self._setup_ui_layer()
         self._add_footer()
 
         self.is_muted = False
         self.show_main_menu()
 
+        # audio starts once the window has painted its first frame
+        QTimer.singleShot(0, self._init_mixer)
+
     # ────────────────────────────────────────────────────────────────────────
     # Background / Animation
     # ────────────────────────────────────────────────────────────────────────
@@ -47,7 +67,12 @@ class MainWindow(QMainWindow):
         self.movie_label = QLabel(self)
         self.movie_label.setGeometry(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
         self.movie_label.setScaledContents(True)
-        self.movie = QMovie(GIF_PATHS[0])
+        # both fog GIFs are opened once and swapped, not re-read every switch
+        self.movies = [QMovie(p) for p in GIF_PATHS]
+        for m in self.movies:
+            # decode each frame once and replay loops from memory
+            m.setCacheMode(QMovie.CacheMode.CacheAll)
+        self.movie = self.movies[0]
         self.movie_label.setMovie(self.movie)
         self.movie.start()
 
@@ -55,37 +80,97 @@ class MainWindow(QMainWindow):
         self.gif_timer.timeout.connect(self._pause_and_switch_gif)
         self.gif_timer.start(GIF_INTERVAL)
 
+        # one reusable single-shot for the pause before each switch
+        self._switch_timer = QTimer(self)
+        self._switch_timer.setSingleShot(True)
+        self._switch_timer.timeout.connect(self._switch_background_gif)
+
     def _pause_and_switch_gif(self):
-        QTimer.singleShot(GIF_PAUSE, self._switch_background_gif)
+        self._switch_timer.start(GIF_PAUSE)
 
     def _switch_background_gif(self):
-        self.gif_index = (self.gif_index + 1) % len(GIF_PATHS)
+        if self._background_paused():
+            return  # _sync_background restarts the cycle on resume
+        self.gif_index = (self.gif_index + 1) % len(self.movies)
         self.movie.stop()
-        self.movie = QMovie(GIF_PATHS[self.gif_index])
+        self.movie = self.movies[self.gif_index]
         self.movie_label.setMovie(self.movie)
         self.movie.start()
         self.gif_timer.start(GIF_INTERVAL)
 
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._sync_background()
+
+    def _background_paused(self):
+        # nothing is on screen while minimised, and on the randomiser pages
+        # the spins have the CPU; a still fog frame stays behind them
+        return self.isMinimized() or not self._on_menu
+
+    def _pause_bg(self):
+        self.movie.setPaused(True)
+        self.gif_timer.stop()
+        self._switch_timer.stop()
+
+    def _resume_bg(self):
+        self.movie.setPaused(False)
+        if not self.gif_timer.isActive():
+            self.gif_timer.start(GIF_INTERVAL)
+
+    def _sync_background(self):
+        if self._background_paused():
+            self._pause_bg()
+        else:
+            self._resume_bg()
+
+    def _prefetch_assets(self):
+        # decode killer portraits, addons and both perk sets on the pool while
+        # the fog plays, so the first spin finds them already scaled in the cache
+        image_cache.prefetch_folders([image_path("killers")], PORTRAIT_SIZE)
+        image_cache.prefetch_folders([image_path("killer_addons")], ADDON_SIZE, nested=True)
+        image_cache.prefetch_folders([KILLER_PERKS, SURVIVOR_PERKS], PERK_SIZE)
+        image_cache.prune_disk_cache()
+
     # ────────────────────────────────────────────────────────────────────────
     # Audio
     # ────────────────────────────────────────────────────────────────────────
-    def _setup_audio(self):
-        pygame.mixer.init()
+    # pygame (and SDL behind it) is imported on first use, after the
+    # window is up, rather than at module import
+    def _init_mixer(self):
+        import pygame
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=MIXER_BUFFER)
         try:
             pygame.mixer.music.load(THEME_MUSIC)
             pygame.mixer.music.set_volume(DEFAULT_VOL)
             pygame.mixer.music.play(-1)
         except pygame.error as e:
             print(f"[ERROR] Loading theme music: {e}")
+        QTimer.singleShot(50, self._load_sounds)
 
+    def _load_sounds(self):
+        import pygame
         try:
-            self.sfx_hover = pygame.mixer.Sound(SFX_HOVER)
-            self.sfx_click = pygame.mixer.Sound(SFX_CLICK)
-            self.sfx_hover.set_volume(0.2)
-            self.sfx_click.set_volume(0.2)
+            hover = pygame.mixer.Sound(SFX_HOVER)
+            click = pygame.mixer.Sound(SFX_CLICK)
+            hover.set_volume(0.2)
+            click.set_volume(0.2)
+            # channels 0/1 belong to the SFX; reserved so nothing else lands there
+            pygame.mixer.set_num_channels(4)
+            pygame.mixer.set_reserved(2)
+            self.sfx_hover = _ChannelSound(hover, pygame.mixer.Channel(0))
+            self.sfx_click = _ChannelSound(click, pygame.mixer.Channel(1))
         except pygame.error:
             print("[WARNING] Could not load SFX.")
             self.sfx_hover = self.sfx_click = None
+            return
+
+        # buttons built before the sounds loaded (the main menu) pick them up now
+        for btn in self.ui_layer.findChildren(AnimatedButton):
+            if btn.hover_sound is None:
+                btn.hover_sound = self.sfx_hover
+            if btn.click_sound is None:
+                btn.click_sound = self.sfx_click
 
     # ────────────────────────────────────────────────────────────────────────
     # UI Layer & Footer
@@ -95,7 +180,12 @@ class MainWindow(QMainWindow):
         self.ui_layer.setGeometry(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
         self.ui_layer.setStyleSheet("background: transparent;")
         self.ui_layout = QVBoxLayout(self.ui_layer)
-        self.ui_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.ui_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Every screen is a page, built on its first visit and kept after
+        self.ui_stack = QStackedWidget()
+        self.ui_layout.addWidget(self.ui_stack)
+        self._pages = {}
 
     def _add_footer(self):
         # Credits
@@ -112,9 +202,11 @@ class MainWindow(QMainWindow):
                     self.height() - credit.height() - 10)
         self.credit_label = credit
 
-        # Mute button
+        # Mute button; both icons loaded once for _toggle_mute
+        self._icon_unmute = QIcon("images/menu/unmute.png")
+        self._icon_mute   = QIcon("images/menu/mute.png")
         mute = QPushButton(parent=self.ui_layer)
-        mute.setIcon(QIcon("images/menu/unmute.png"))
+        mute.setIcon(self._icon_unmute)
         mute.setFixedSize(44, 44)
         mute.setIconSize(QSize(32, 32))
         mute.setStyleSheet("background:transparent; border:none;")
@@ -123,19 +215,30 @@ class MainWindow(QMainWindow):
         mute.show()
         self.mute_btn = mute
 
+        # A window drag fires resizeEvent far faster than the screen
+        # refreshes; re-lay the layers once it has been still for ~one frame
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._apply_resize)
+
     def _toggle_mute(self):
+        import pygame
         if not pygame.mixer.get_init():
             return
         if self.is_muted:
             pygame.mixer.music.set_volume(DEFAULT_VOL)
-            self.mute_btn.setIcon(QIcon("images/menu/unmute.png"))
+            self.mute_btn.setIcon(self._icon_unmute)
         else:
             pygame.mixer.music.set_volume(0.0)
-            self.mute_btn.setIcon(QIcon("images/menu/mute.png"))
+            self.mute_btn.setIcon(self._icon_mute)
         self.is_muted = not self.is_muted
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self._resize_timer.start()  # restart: debounce until the drag pauses
+
+    def _apply_resize(self):
         self.movie_label.resize(self.size())
         self.ui_layer.resize(self.size())
         self.credit_label.move(
@@ -150,18 +253,27 @@ class MainWindow(QMainWindow):
     # ────────────────────────────────────────────────────────────────────────
     # Helpers
     # ────────────────────────────────────────────────────────────────────────
-    def clear_overlay_layout(self):
-        while self.ui_layout.count():
-            item = self.ui_layout.takeAt(0)
-            if widget := item.widget():
-                widget.setParent(None)
+    def _show_page(self, key, build, menu=False):
+        """Raise the page cached under `key`, filling it with `build(layout)` on first use."""
+        page = self._pages.get(key)
+        if page is None:
+            page = QWidget()
+            layout = QVBoxLayout(page)
+            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            build(layout)
+            self.ui_stack.addWidget(page)
+            self._pages[key] = page
+        self.ui_stack.setCurrentWidget(page)
+        self._on_menu = menu
+        self._sync_background()
 
     # ────────────────────────────────────────────────────────────────────────
     # Main Menu
     # ────────────────────────────────────────────────────────────────────────
     def show_main_menu(self):
-        self.clear_overlay_layout()
+        self._show_page("main_menu", self._build_main_menu, menu=True)
 
+    def _build_main_menu(self, layout):
         # Logo
         logo = QLabel()
         pix = QPixmap("images/menu/dbdroulettelogo.png")
@@ -170,8 +282,8 @@ class MainWindow(QMainWindow):
         ))
         logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         logo.setStyleSheet("background: transparent;")
-        self.ui_layout.addWidget(logo)
-        self.ui_layout.addSpacing(20)
+        layout.addWidget(logo)
+        layout.addSpacing(20)
 
         # Killer / Survivor buttons
         killer_btn = AnimatedButton(
@@ -186,15 +298,16 @@ class MainWindow(QMainWindow):
         killer_btn.clicked.connect(self.show_killer_menu)
         survivor_btn.clicked.connect(self.show_survivor_menu)
 
-        self.ui_layout.addWidget(killer_btn)
-        self.ui_layout.addWidget(survivor_btn)
+        layout.addWidget(killer_btn)
+        layout.addWidget(survivor_btn)
 
     # ────────────────────────────────────────────────────────────────────────
     # Killer Sub‑Menu
     # ────────────────────────────────────────────────────────────────────────
     def show_killer_menu(self):
-        self.clear_overlay_layout()
+        self._show_page("killer_menu", self._build_killer_menu, menu=True)
 
+    def _build_killer_menu(self, layout):
         kb = AnimatedButton("Killer Randomiser", hover_color="#982c1c",
                             hover_sound=self.sfx_hover, click_sound=self.sfx_click)
         kb.clicked.connect(self.show_killer_randomiser)
@@ -215,33 +328,31 @@ class MainWindow(QMainWindow):
 
         for w in (kb, pk, fb, back):
             w.setFixedSize(250, 50)
-            self.ui_layout.addWidget(w,
-                                     alignment=Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(w,
+                             alignment=Qt.AlignmentFlag.AlignCenter)
 
     def show_killer_randomiser(self):
-        self.clear_overlay_layout()
-        kd = KillerDisplay(
+        self._show_page("killer_randomiser", lambda layout: layout.addWidget(KillerDisplay(
             back_callback=self.show_killer_menu,
             hover_sound=self.sfx_hover,
             click_sound=self.sfx_click
-        )
-        self.ui_layout.addWidget(kd)
+        )))
 
     def show_full_randomiser(self):
-        self.clear_overlay_layout()
-        fd = FullDisplay(
+        from ui_full_killer_randomiser import FullDisplay
+        self._show_page("full_randomiser", lambda layout: layout.addWidget(FullDisplay(
             back_callback=self.show_killer_menu,
             hover_sound=self.sfx_hover,
             click_sound=self.sfx_click
-        )
-        self.ui_layout.addWidget(fd)
+        )))
 
     # ────────────────────────────────────────────────────────────────────────
     # Survivor Sub‑Menu
     # ────────────────────────────────────────────────────────────────────────
     def show_survivor_menu(self):
-        self.clear_overlay_layout()
+        self._show_page("survivor_menu", self._build_survivor_menu, menu=True)
 
+    def _build_survivor_menu(self, layout):
         perk_btn = AnimatedButton("Perk Roulette",
             hover_color="#405c94",
             hover_sound=self.sfx_hover, click_sound=self.sfx_click)
@@ -259,38 +370,32 @@ class MainWindow(QMainWindow):
 
         for w in (perk_btn, full_btn, back):
             w.setFixedSize(250, 50)
-            self.ui_layout.addWidget(w,
-                                     alignment=Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(w,
+                             alignment=Qt.AlignmentFlag.AlignCenter)
 
     def show_full_survivor_randomiser(self):
-        self.clear_overlay_layout()
         from ui_full_survivor_randomiser import FullSurvivorDisplay
-        fd = FullSurvivorDisplay(
+        self._show_page("full_survivor_randomiser", lambda layout: layout.addWidget(FullSurvivorDisplay(
             back_callback=self.show_survivor_menu,
             hover_sound=self.sfx_hover,
             click_sound=self.sfx_click
-        )
-        self.ui_layout.addWidget(fd)
+        )))
 
     # ────────────────────────────────────────────────────────────────────────
     # Perk‑Roulette helpers (so “Back” returns to the right submenu)
     # ────────────────────────────────────────────────────────────────────────
     def show_killer_perk_roulette(self):
-        self.clear_overlay_layout()
-        disp = PerkDisplay(
-            "images/killer_perks",
+        self._show_page("killer_perk_roulette", lambda layout: layout.addWidget(PerkDisplay(
+            KILLER_PERKS,
             back_callback=self.show_killer_menu,
             hover_sound=self.sfx_hover,
             click_sound=self.sfx_click
-        )
-        self.ui_layout.addWidget(disp)
+        )))
 
     def show_survivor_perk_roulette(self):
-        self.clear_overlay_layout()
-        disp = PerkDisplay(
-            "images/survivor_perks",
+        self._show_page("survivor_perk_roulette", lambda layout: layout.addWidget(PerkDisplay(
+            SURVIVOR_PERKS,
             back_callback=self.show_survivor_menu,
             hover_sound=self.sfx_hover,
             click_sound=self.sfx_click
-        )
-        self.ui_layout.addWidget(disp)
\ No newline at end of file
+        )))
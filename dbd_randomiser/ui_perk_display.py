@@ -1,12 +1,13 @@
 # ui_perk_display.py
 import os
 import random
+import time
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
 from PyQt6.QtCore    import Qt, QTimer
-from PyQt6.QtGui     import QPixmap
 
-from widgets import AnimatedButton, ClickableLabel
-from utils    import format_perk_name
+from widgets     import AnimatedButton, ClickableLabel
+from utils       import format_perk_name, spin_step
+from image_cache import image_cache
 
 FRAME_SIZE    = 160
 IMAGE_SIZE    = 128
@@ -23,11 +24,11 @@ class PerkDisplay(QWidget):
         self.hover_sound   = hover_sound
         self.click_sound   = click_sound
 
-        # Gather all perk images
-        self.perk_files = [
-            f for f in os.listdir(perk_folder)
+        # Gather all perk images (one scandir pass, shared with other views)
+        self.perk_files = tuple(
+            f for f in image_cache.listing(perk_folder)
             if not f.startswith("helpLoading")
-        ]
+        )
         placeholder_name = (
             "helpLoadingKiller.png"
             if "killer" in perk_folder.lower()
@@ -35,6 +36,12 @@ class PerkDisplay(QWidget):
         )
         self.placeholder_path = os.path.join(perk_folder, placeholder_name)
 
+        # Full paths parallel to perk_files, scaled into the shared cache in
+        # the background so the first spin doesn't decode on the GUI thread
+        self._perk_paths = tuple(os.path.join(perk_folder, f) for f in self.perk_files)
+        image_cache.prefetch(self._perk_paths, IMAGE_SIZE)
+        self._placeholder_pix = image_cache.get(self.placeholder_path, IMAGE_SIZE)
+
         # UI state
         self.image_labels    = []
         self.text_labels     = []
@@ -59,21 +66,14 @@ class PerkDisplay(QWidget):
                     border-radius: 10px;
                 }
             """)
-            lay = QVBoxLayout(frame)
-            lay.setContentsMargins(0,0,0,0)
-            lay.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            img = ClickableLabel()
+            # fixed sizes on both, so centre the icon by hand rather than
+            # giving every frame a layout of its own
+            img = ClickableLabel(frame)
             img.setFixedSize(IMAGE_SIZE, IMAGE_SIZE)
-            pix = QPixmap(self.placeholder_path).scaled(
-                IMAGE_SIZE, IMAGE_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            img.setPixmap(pix)
+            img.move((FRAME_SIZE - IMAGE_SIZE) // 2, (FRAME_SIZE - IMAGE_SIZE) // 2)
+            img.setPixmap(self._placeholder_pix)
             img.setToolTip("Click to reroll this perk")
             img.clicked.connect(lambda *args, i=idx: self._start_perk_spin(i))
-            lay.addWidget(img)
 
             # Label
             txt = QLabel("", self)
@@ -119,7 +119,7 @@ class PerkDisplay(QWidget):
         self.spin_button.setFixedSize(200, 50)
         self.spin_button.clicked.connect(self._start_spin)
 
-        back_button = AnimatedButton(
+        self.back_button = AnimatedButton(
             "Back",
             hover_color="#555",
             base_color="#111",
@@ -127,14 +127,14 @@ class PerkDisplay(QWidget):
             hover_sound=self.hover_sound,
             click_sound=self.click_sound
         )
-        back_button.setFixedSize(150, 50)
-        back_button.clicked.connect(self.back_callback)
+        self.back_button.setFixedSize(150, 50)
+        self.back_button.clicked.connect(self.back_callback)
 
         btns = QVBoxLayout()
         btns.setAlignment(Qt.AlignmentFlag.AlignCenter)
         btns.addWidget(self.spin_button, alignment=Qt.AlignmentFlag.AlignCenter)
         btns.addSpacing(8)
-        btns.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
+        btns.addWidget(self.back_button, alignment=Qt.AlignmentFlag.AlignCenter)
         main_layout.addLayout(btns)
 
         # TIP
@@ -142,73 +142,100 @@ class PerkDisplay(QWidget):
         tip.setStyleSheet("color: #ccc; font-size: 8pt;")
         main_layout.addWidget(tip, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        # Full‑group spin timer
-        self._spin_counter = 0
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._animate_spin)
-
-        # Single‑slot spin timer
-        self._single_idx     = None
-        self._single_counter = 0
-        self._single_timer   = QTimer(self)
-        self._single_timer.timeout.connect(self._animate_single)
+        # own generator, so spins don't share the module-level random state
+        self._rng = random.Random()
+
+        # Each spin keeps the time.monotonic() it started at and works out
+        # its step from the elapsed time, so a late tick doesn't lengthen it.
+        # Full‑group spin; the step is read by the full views
+        self._spin_start = 0.0
+        self._spin_step  = 0
+        self._spin_seq   = ()
+
+        # Single‑slot spin
+        self._single_idx   = None
+        self._single_start = 0.0
+        self._single_seq   = ()
+
+        # One persistent timer drives both spins; each channel is an
+        # _animate_* handler that returns True once its spin has finished
+        self._channels = {}
+        self._tick = QTimer(self)
+        self._tick.setTimerType(Qt.TimerType.PreciseTimer)
+        self._tick.timeout.connect(self._on_tick)
+
+    def _run(self, channel):
+        """Add a spin handler to the shared timer, starting it if idle."""
+        self._channels[channel] = None
+        if not self._tick.isActive():
+            self._tick.start(SPIN_INTERVAL)
+
+    def _on_tick(self):
+        for channel in list(self._channels):
+            if channel():
+                self._channels.pop(channel, None)
+        if not self._channels:
+            self._tick.stop()
+
+    def hideEvent(self, event):
+        # the main window's page stack keeps this view alive while hidden
+        self._tick.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._channels:
+            self._tick.start(SPIN_INTERVAL)
+
+    def _spin_order(self, per_tick=1):
+        """Shuffled perk indices for a whole spin, drawn in one call and cycled through."""
+        n = len(self._perk_paths)
+        return self._rng.sample(range(n), min(n, (SPIN_STEPS + 1) * per_tick))
 
     def _start_spin(self):
-        self._spin_counter = 0
-        self._timer.start(SPIN_INTERVAL)
+        self._spin_start = time.monotonic()
+        self._spin_step  = 0
+        self._spin_seq   = self._spin_order(len(self.image_labels))
+        self._run(self._animate_spin)
 
     def _animate_spin(self):
-        self._spin_counter += 1
-        for lbl in self.image_labels:
-            choice = random.choice(self.perk_files)
-            pix = QPixmap(os.path.join(self.perk_folder, choice)).scaled(
-                IMAGE_SIZE, IMAGE_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            lbl.setPixmap(pix)
-        if self._spin_counter > SPIN_STEPS:
-            self._timer.stop()
+        self._spin_step = step = spin_step(self._spin_start, SPIN_INTERVAL)
+        # consecutive runs of the shuffled order, so the four frames stay distinct like the reveal
+        paths, seq = self._perk_paths, self._spin_seq
+        base = step * len(self.image_labels)
+        for j, lbl in enumerate(self.image_labels):
+            lbl.setPixmap(image_cache.get(paths[seq[(base + j) % len(seq)]], IMAGE_SIZE, smooth=False, fallback=self._placeholder_pix))
+        if step > SPIN_STEPS:
             self._reveal_perks()
+            return True
+        return False
 
     def _reveal_perks(self):
-        picks = random.sample(self.perk_files, len(self.image_labels))
-        for i, fname in enumerate(picks):
-            path = os.path.join(self.perk_folder, fname)
-            pix  = QPixmap(path).scaled(
-                IMAGE_SIZE, IMAGE_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.image_labels[i].setPixmap(pix)
-            self.text_labels[i].setText(format_perk_name(fname))
+        paths = self._perk_paths
+        picks = self._rng.sample(range(len(paths)), len(self.image_labels))
+        for img, txt, i in zip(self.image_labels, self.text_labels, picks):
+            img.setPixmap(image_cache.get(paths[i], IMAGE_SIZE))
+            txt.setText(format_perk_name(self.perk_files[i]))
 
     def _start_perk_spin(self, idx):
-        self._single_idx     = idx
-        self._single_counter = 0
-        self._single_timer.start(SPIN_INTERVAL)
+        self._single_idx   = idx
+        self._single_start = time.monotonic()
+        self._single_seq   = self._spin_order()
+        self._run(self._animate_single)
 
     def _animate_single(self):
         i = self._single_idx
-        self._single_counter += 1
-        choice = random.choice(self.perk_files)
-        pix = QPixmap(os.path.join(self.perk_folder, choice)).scaled(
-            IMAGE_SIZE, IMAGE_SIZE,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        step = spin_step(self._single_start, SPIN_INTERVAL)
+        seq  = self._single_seq
+        path = self._perk_paths[seq[step % len(seq)]]
+        pix  = image_cache.get(path, IMAGE_SIZE, smooth=False, fallback=self._placeholder_pix)
         self.image_labels[i].setPixmap(pix)
-        if self._single_counter > SPIN_STEPS:
-            self._single_timer.stop()
+        if step > SPIN_STEPS:
             self._reroll_perk(i)
+            return True
+        return False
 
     def _reroll_perk(self, idx):
-        fname = random.choice(self.perk_files)
-        path  = os.path.join(self.perk_folder, fname)
-        pix   = QPixmap(path).scaled(
-            IMAGE_SIZE, IMAGE_SIZE,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.image_labels[idx].setPixmap(pix)
-        self.text_labels[idx].setText(format_perk_name(fname))
+        i = self._rng.randrange(len(self._perk_paths))
+        self.image_labels[idx].setPixmap(image_cache.get(self._perk_paths[i], IMAGE_SIZE))
+        self.text_labels[idx].setText(format_perk_name(self.perk_files[i]))
@@ -2,17 +2,18 @@ import os
 import random
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
 from PyQt6.QtCore    import Qt, QTimer
-from PyQt6.QtGui     import QPixmap
 
-from widgets import AnimatedButton, ClickableLabel
-from utils    import format_perk_name
+from widgets     import AnimatedButton, ClickableLabel
+from utils       import format_perk_name
+from image_cache import image_cache
 
 SPIN_INTERVAL = 100
 SPIN_STEPS    = 20
 
+_BASE = os.path.dirname(os.path.abspath(__file__))
+
 def image_path(*parts):
-    base = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base, "images", *parts)
+    return os.path.join(_BASE, "images", *parts)
 
 class SurvivorDisplay(QWidget):
     """Spin survivor portrait → item → item‐addons (2) → show names, with per‑icon reroll."""
@@ -27,11 +28,20 @@ class SurvivorDisplay(QWidget):
         self.item_dir     = image_path("survivor_items")
         self.addons_root  = image_path("survivor_items", "addons")
 
-        self.portraits = [f for f in os.listdir(self.portrait_dir) if f.lower().endswith(".png")]
-        self.items     = [f for f in os.listdir(self.item_dir)     if f.lower().endswith(".png")]
+        # folder → mtime its cached listing was read at (None once it's gone)
+        self._mtimes = {}
+        self.portraits = self.items = self._portrait_paths = self._item_paths = ()
+        # also scales portraits and items on the pool now, so the first
+        # spin doesn't decode them on the GUI thread
+        self._refresh_listings()
 
-        self.placeholder = QPixmap(image_path("survivor_perks","helpLoadingSurvivor.png"))\
-            .scaled(200,200,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
+        # the placeholder at each label's size, so the item label doesn't clip a 200 px one
+        placeholder = image_path("survivor_perks","helpLoadingSurvivor.png")
+        self.placeholder        = self._get_pix(placeholder, 200)
+        self._placeholder_item  = self._get_pix(placeholder, 160)
+        self._placeholder_small = self._get_pix(placeholder, 100)
+        # shown by a spin frame whose icon is still decoding on the pool
+        self._placeholders = {200: self.placeholder, 160: self._placeholder_item, 100: self._placeholder_small}
 
         # ── build UI ──────────────────────────────────────────────────
         self.setStyleSheet("background:transparent;")
@@ -51,7 +61,7 @@ class SurvivorDisplay(QWidget):
         # item
         self.item_lbl = ClickableLabel()
         self.item_lbl.setFixedSize(160,160)
-        self.item_lbl.setPixmap(self.placeholder)
+        self.item_lbl.setPixmap(self._placeholder_item)
         self.item_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.item_lbl.setToolTip("Click to reroll item (resets its addons)")
         self.item_lbl.clicked.connect(lambda: self._start_slot("item"))
@@ -73,11 +83,7 @@ class SurvivorDisplay(QWidget):
             col = QVBoxLayout(); col.setAlignment(Qt.AlignmentFlag.AlignCenter)
             a_img = ClickableLabel()
             a_img.setFixedSize(100,100)
-            a_img.setPixmap(self.placeholder.scaled(
-                100,100,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            ))
+            a_img.setPixmap(self._placeholder_small)
             a_img.setAlignment(Qt.AlignmentFlag.AlignCenter)
             a_img.setToolTip("Click to reroll this addon")
             a_img.clicked.connect(lambda *args, i=idx: self._start_slot("addon", i))
@@ -117,127 +123,215 @@ class SurvivorDisplay(QWidget):
         tip.setStyleSheet("color: #ccc; font-size: 8pt;")
         root.addWidget(tip, alignment=Qt.AlignmentFlag.AlignCenter)
 
+        # own generator, so spins don't share the module-level random state
+        self._rng = random.Random()
+
         # full‑sequence spin
         self._phase     = 0
         self._phase_cnt = 0
-        self.timer      = QTimer(self)
-        self.timer.timeout.connect(self._animate)
+        self._phase_seq = ()
 
         # single‑slot spin
         self._slot_type    = None
         self._slot_idx     = None
         self._slot_counter = 0
-        self._slot_timer   = QTimer(self)
-        self._slot_timer.timeout.connect(self._animate_slot)
+        self._slot_seq     = ()
+
+        # One timer drives both spins; each channel is an _animate* handler
+        # that returns True once its spin has finished
+        self._channels = {}
+        self._tick = QTimer(self)
+        self._tick.setTimerType(Qt.TimerType.PreciseTimer)
+        self._tick.timeout.connect(self._on_tick)
+
+    def _get_pix(self, path, size, smooth=True):
+        """Return `path` scaled to `size` from the shared cache; spin frames pass smooth=False."""
+        if smooth:
+            return image_cache.get(path, size)
+        return image_cache.get(path, size, smooth=False, fallback=self._placeholders[size])
+
+    # ─── listings ───────────────────────────────────────────
+    def _relist(self, folder):
+        """`folder`'s PNG names, rescanned if it changed on disk since last read; () if it's gone."""
+        try:
+            mtime = os.stat(folder).st_mtime
+        except OSError:
+            mtime = None
+        if folder in self._mtimes and self._mtimes[folder] != mtime:
+            image_cache.invalidate(folder)  # changed on disk since the last read
+        self._mtimes[folder] = mtime
+        if mtime is None:
+            return ()
+        try:
+            return image_cache.listing(folder)
+        except OSError:
+            return ()
+
+    def _refresh_listings(self):
+        """Pick up portraits and items added or removed on disk since the last spin."""
+        portraits = self._relist(self.portrait_dir)
+        if portraits is not self.portraits:
+            self.portraits = portraits
+            # full paths parallel to the listing, joined once rather than per tick
+            self._portrait_paths = tuple(os.path.join(self.portrait_dir, f) for f in portraits)
+            image_cache.prefetch(self._portrait_paths, 200)
+        items = self._relist(self.item_dir)
+        if items is not self.items:
+            self.items = items
+            self._item_paths = tuple(os.path.join(self.item_dir, f) for f in items)
+            image_cache.prefetch(self._item_paths, 160)
+
+    def _spin_order(self, n, per_tick=1):
+        """Shuffled indices into `n` files for a whole spin, drawn in one call and cycled through."""
+        return self._rng.sample(range(n), min(n, (SPIN_STEPS + 1) * per_tick))
+
+    # ─── shared timer ─────────────────────────────────────────
+    def _run(self, channel):
+        """Add a spin handler to the shared timer, starting it if idle."""
+        self._channels[channel] = None
+        if not self._tick.isActive():
+            self._tick.start(SPIN_INTERVAL)
+
+    def _on_tick(self):
+        for channel in list(self._channels):
+            if channel():
+                self._channels.pop(channel, None)
+        if not self._channels:
+            self._tick.stop()
+
+    # ─── pause while off screen ─────────────────────────────
+    def hideEvent(self, event):
+        # the main window's page stack keeps this view alive while hidden
+        self._tick.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._channels:
+            self._tick.start(SPIN_INTERVAL)
 
     def _phase_portrait(self):
+        self._refresh_listings()
+        if not self.portraits or not self.items:
+            return
         self._phase = 1
         self._phase_cnt = 0
+        self._phase_seq = self._spin_order(len(self.portraits))
         # clear old
         self.item_lbl.clear(); self.item_name.clear()
         for img,txt in zip(self.addon_lbls,self.addon_names):
-            img.setPixmap(self.placeholder); txt.clear()
-        self.timer.start(SPIN_INTERVAL)
+            img.setPixmap(self._placeholder_small); txt.clear()
+        self._run(self._animate)
 
     def _animate(self):
         self._phase_cnt += 1
+        seq = self._phase_seq
         if self._phase == 1:
-            choice = random.choice(self.portraits)
-            self.portrait_lbl.setPixmap(
-                QPixmap(os.path.join(self.portrait_dir,choice)).scaled(200,200,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-            )
+            path = self._portrait_paths[seq[self._phase_cnt % len(seq)]]
+            self.portrait_lbl.setPixmap(self._get_pix(path, 200, smooth=False))
             if self._phase_cnt>SPIN_STEPS:
+                self.portrait_lbl.setPixmap(self._get_pix(path, 200))
+                self._phase_seq = self._spin_order(len(self.items))
                 self._phase=2; self._phase_cnt=0
 
         elif self._phase == 2:
-            choice = random.choice(self.items)
-            self.item_lbl.setPixmap(
-                QPixmap(os.path.join(self.item_dir,choice)).scaled(160,160,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-            )
+            i = seq[self._phase_cnt % len(seq)]
+            self.item_lbl.setPixmap(self._get_pix(self._item_paths[i], 160, smooth=False))
             if self._phase_cnt>SPIN_STEPS:
+                choice = self.items[i]
+                self.item_lbl.setPixmap(self._get_pix(self._item_paths[i], 160))
                 self.item_name.setText(format_perk_name(choice))
                 self._picked_item = os.path.splitext(choice)[0]
+                self._bind_addons()
+                if not self._addon_all:  # no addons for this item: the spin ends here
+                    return True
+                self._phase_seq = self._spin_order(len(self._addon_all), len(self.addon_lbls))
                 self._phase=3; self._phase_cnt=0
 
         elif self._phase == 3:
-            addon_folder = os.path.join(self.addons_root,self._picked_item)
-            all_add = [f for f in os.listdir(addon_folder) if f.lower().endswith('.png')]
-            for lbl in self.addon_lbls:
-                fn = random.choice(all_add)
-                lbl.setPixmap(
-                    QPixmap(os.path.join(addon_folder,fn)).scaled(100,100,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-                )
+            # consecutive runs of the shuffled order, one index per slot
+            base = self._phase_cnt * len(self.addon_lbls)
+            for j, lbl in enumerate(self.addon_lbls):
+                lbl.setPixmap(self._get_pix(self._addon_paths[seq[(base + j) % len(seq)]], 100, smooth=False))
             if self._phase_cnt>SPIN_STEPS:
-                self._addon_files = random.sample(all_add,2)
+                n = len(self._addon_all)
+                self._addon_picks = self._rng.sample(range(n), min(n, 2))
                 self._phase=4; self._phase_cnt=0
 
         elif self._phase == 4:
             # reveal exactly 2 and names
-            addon_folder = os.path.join(self.addons_root,self._picked_item)
-            for lbl,txt,fn in zip(self.addon_lbls,self.addon_names,self._addon_files):
-                lbl.setPixmap(
-                    QPixmap(os.path.join(addon_folder,fn)).scaled(100,100,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-                )
-                txt.setText(format_perk_name(fn))
-            self.timer.stop()
+            for lbl,txt,i in zip(self.addon_lbls,self.addon_names,self._addon_picks):
+                lbl.setPixmap(self._get_pix(self._addon_paths[i], 100))
+                txt.setText(format_perk_name(self._addon_all[i]))
+            return True
+        return False
 
     def _reroll_survivor(self):
-        choice = random.choice(self.portraits)
-        pix = QPixmap(os.path.join(self.portrait_dir, choice))\
-            .scaled(200,200,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
+        pix = self._get_pix(self._rng.choice(self._portrait_paths), 200)
         self.portrait_lbl.setPixmap(pix)
 
     def _reroll_item(self):
-        choice = random.choice(self.items)
-        self.item_lbl.setPixmap(
-            QPixmap(os.path.join(self.item_dir,choice)).scaled(160,160,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
-        )
+        i = self._rng.randrange(len(self.items))
+        choice = self.items[i]
+        self.item_lbl.setPixmap(self._get_pix(self._item_paths[i], 160))
         self.item_name.setText(format_perk_name(choice))
         self._picked_item = os.path.splitext(choice)[0]
+        self._bind_addons()
         # now reroll both addons to match the new item
         for i in (0,1):
             self._reroll_addon(i)
 
-    def _reroll_addon(self, idx):
+    def _bind_addons(self):
+        """Bind the picked item's addon listing, for every spin until the item changes."""
         folder = os.path.join(self.addons_root, self._picked_item)
-        all_add = [f for f in os.listdir(folder) if f.lower().endswith('.png')]
-        fn = random.choice(all_add)
-        pix = QPixmap(os.path.join(folder,fn)).scaled(100,100,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
+        self._addon_all   = self._relist(folder)
+        self._addon_paths = tuple(os.path.join(folder, f) for f in self._addon_all)
+
+    def _reroll_addon(self, idx):
+        if not self._addon_all:
+            return
+        i = self._rng.randrange(len(self._addon_all))
+        pix = self._get_pix(self._addon_paths[i], 100)
         self.addon_lbls[idx].setPixmap(pix)
-        self.addon_names[idx].setText(format_perk_name(fn))
+        self.addon_names[idx].setText(format_perk_name(self._addon_all[i]))
 
     # ─── single‑slot handlers ─────────────────────────────────
     def _start_slot(self, slot_type, idx=None):
+        if slot_type == "addon":
+            if not hasattr(self, "_picked_item"):
+                return
+            self._bind_addons()
+            files = self._addon_all
+        else:
+            self._refresh_listings()
+            files = self.portraits if slot_type == "portrait" else self.items
+        if not files:
+            return
         self._slot_type    = slot_type
         self._slot_idx     = idx
         self._slot_counter = 0
-        self._slot_timer.start(SPIN_INTERVAL)
+        self._slot_seq     = self._spin_order(len(files))
+        self._run(self._animate_slot)
 
     def _animate_slot(self):
         self._slot_counter += 1
+        i = self._slot_seq[self._slot_counter % len(self._slot_seq)]
         if self._slot_type == "portrait":
-            choice = random.choice(self.portraits)
-            pix    = QPixmap(os.path.join(self.portrait_dir, choice))\
-                        .scaled(200,200,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
+            pix    = self._get_pix(self._portrait_paths[i], 200, smooth=False)
             self.portrait_lbl.setPixmap(pix)
         elif self._slot_type == "item":
-            choice = random.choice(self.items)
-            pix    = QPixmap(os.path.join(self.item_dir, choice))\
-                        .scaled(160,160,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
+            pix    = self._get_pix(self._item_paths[i], 160, smooth=False)
             self.item_lbl.setPixmap(pix)
         else:  # addon
-            folder = os.path.join(self.addons_root, self._picked_item)
-            all_add = [f for f in os.listdir(folder) if f.lower().endswith(".png")]
-            fn = random.choice(all_add)
-            pix = QPixmap(os.path.join(folder, fn))\
-                      .scaled(100,100,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation)
+            pix = self._get_pix(self._addon_paths[i], 100, smooth=False)
             self.addon_lbls[self._slot_idx].setPixmap(pix)
 
         if self._slot_counter > SPIN_STEPS:
-            self._slot_timer.stop()
             if self._slot_type == "portrait":
                 self._reroll_survivor()
             elif self._slot_type == "item":
                 self._reroll_item()
             else:
-                self._reroll_addon(self._slot_idx)
\ No newline at end of file
+                self._reroll_addon(self._slot_idx)
+            return True
+        return False
\ No newline at end of file
@@ -1,6 +1,8 @@
 import os
-import re
+import time
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def format_perk_name(filename: str) -> str:
     """
     Convert e.g. 'DeadHard.png' or 'dead_hard.png'
@@ -8,5 +10,30 @@ def format_perk_name(filename: str) -> str:
     """
     name, _ = os.path.splitext(filename)
     name = name.replace('_',' ')
-    name = re.sub(r'(?<!^)(?=[A-Z])', ' ', name)
-    return name.upper()
+    # one pass: a space before every capital except the first character
+    out = []
+    for i, c in enumerate(name):
+        if i and 'A' <= c <= 'Z':
+            out.append(' ')
+        out.append(c)
+    return ''.join(out).upper()
+
+def spin_step(start, interval):
+    """Whole `interval`-ms steps since `start`, a time.monotonic() reading; late ticks can't stretch a spin."""
+    return int((time.monotonic() - start) * 1000) // interval
+
+def pick_two(randrange, n):
+    """Two distinct indices into `n` items (just one when n == 1), no list built."""
+    i = randrange(n)
+    if n < 2:
+        return (i,)
+    j = randrange(n - 1)
+    return (i, j + (j >= i))
+
+def pick_other(randrange, files, other):
+    """Random index into `files` that avoids `other`, unless it's the only entry."""
+    if len(files) < 2 or other not in files:
+        return randrange(len(files))
+    skip = files.index(other)
+    i = randrange(len(files) - 1)
+    return i + (i >= skip)
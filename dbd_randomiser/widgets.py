@@ -1,10 +1,32 @@
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QPushButton, QLabel
-from PyQt6.QtCore    import Qt, QPropertyAnimation, pyqtProperty, pyqtSignal
-from PyQt6.QtGui     import QColor
+from PyQt6.QtCore    import Qt, QRectF, QPropertyAnimation, pyqtProperty, pyqtSignal
+from PyQt6.QtGui     import QColor, QPainter
+
+@lru_cache(maxsize=None)
+def _color_ramp(base, hover):
+    """256 (r, g, b) steps from `base` to `hover`, shared by buttons with the same colours."""
+    return tuple(
+        tuple(int(b + (h - b) * i / 255) for b, h in zip(base, hover))
+        for i in range(256)
+    )
 
 class AnimatedButton(QPushButton):
     """Button with smooth hover colors and sound effects."""
 
+    # everything but the animated background, which paintEvent fills in
+    _QSS = """
+            QPushButton {{
+                background-color: transparent;
+                color: {0};
+                font-size: 16pt;
+                padding: 8px 12px;
+                border-radius: 6px;
+                border: 1px solid rgba(255,255,255,0.1);
+            }}
+        """
+
     def __init__(self, text,
                  hover_color,
                  base_color="#222222",
@@ -18,12 +40,16 @@ class AnimatedButton(QPushButton):
         self.text_color      = text_color
         self.hover_sound     = hover_sound
         self.click_sound     = click_sound
+        self._last_rgb       = None
+        self._bg             = QColor(self.base_color)
+        self._ramp           = _color_ramp(self.base_color.getRgb()[:3], self.hover_color.getRgb()[:3])
 
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.anim = QPropertyAnimation(self, b"hoverProgress", self)
         self.anim.setDuration(200)
 
         self.clicked.connect(self._play_click_sound)
+        self.setStyleSheet(self._QSS.format(text_color))
         self._update_style()
 
     def enterEvent(self, event):
@@ -56,23 +82,38 @@ class AnimatedButton(QPushButton):
     hoverProgress = pyqtProperty(float, fget=get_hover_progress, fset=set_hover_progress)
 
     def _update_style(self):
-        r = int(self.base_color.red()   + (self.hover_color.red()   - self.base_color.red())   * self._hover_progress)
-        g = int(self.base_color.green() + (self.hover_color.green() - self.base_color.green()) * self._hover_progress)
-        b = int(self.base_color.blue()  + (self.hover_color.blue()  - self.base_color.blue())  * self._hover_progress)
-        bg = f"rgb({r},{g},{b})"
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg};
-                color: {self.text_color};
-                font-size: 16pt;
-                padding: 8px 12px;
-                border-radius: 6px;
-                border: 1px solid rgba(255,255,255,0.1);
-            }}
-        """)
+        rgb = self._ramp[int(self._hover_progress * 255)]
+        # neighbouring animation frames often land on the same colour;
+        # skip the repaint when nothing changed
+        if rgb == self._last_rgb:
+            return
+        self._last_rgb = rgb
+        self._bg.setRgb(*rgb)
+        self.update()
+
+    def paintEvent(self, event):
+        # fill the rounded background here so a hover frame is a plain
+        # repaint, not a stylesheet reparse; the border and text draw on top
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(self._bg)
+        p.drawRoundedRect(QRectF(self.rect()), 6, 6)
+        p.end()
+        super().paintEvent(event)
 
 class ClickableLabel(QLabel):
     clicked = pyqtSignal()
+
+    def setPixmap(self, pix):
+        # spin ticks often hand back the frame already on screen (the same
+        # file drawn twice, or the cache repeating a frame while a decode is
+        # queued); QLabel would still relayout and repaint for it
+        shown = self.pixmap()
+        if not shown.isNull() and shown.cacheKey() == pix.cacheKey():
+            return
+        super().setPixmap(pix)
+
     def mousePressEvent(self, event):
         super().mousePressEvent(event)
         self.clicked.emit()
\ No newline at end of file
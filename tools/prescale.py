@@ -0,0 +1,60 @@
+"""
+Fill the on-disk scaled-image cache ahead of time, so even the first
+launch skips decoding full-size PNGs. Run it from the repository root,
+after installing or after updating the images folder:
+
+    python tools/prescale.py
+"""
+
+import os, sys
+from PyQt6.QtCore import QCoreApplication
+
+# the app modules import each other by bare name, so load them from their folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "dbd_randomiser"))
+
+from image_cache                 import prescale
+from ui_killer_randomiser        import image_path, PORTRAIT_SIZE, ADDON_SIZE
+from ui_perk_display             import IMAGE_SIZE as PERK_SIZE
+from ui_full_survivor_randomiser import IMAGE_SIZE as SURVIVOR_SIZE
+
+# (folder, size, nested): nested folders hold one subfolder per killer/item
+TARGETS = [
+    (image_path("killers"),                   PORTRAIT_SIZE, False),
+    (image_path("killer_addons"),             ADDON_SIZE,    True),
+    (image_path("killer_perks"),              PERK_SIZE,     False),
+    (image_path("survivor_perks"),            PERK_SIZE,     False),
+    (image_path("survivors"),                 SURVIVOR_SIZE, False),
+    (image_path("survivor_items"),            SURVIVOR_SIZE, False),
+    (image_path("survivor_items", "addons"),  SURVIVOR_SIZE, True),
+]
+
+def _pngs(folder, nested):
+    folders = [folder]
+    if nested:
+        with os.scandir(folder) as it:
+            folders = [e.path for e in it if e.is_dir()]
+    for f in folders:
+        with os.scandir(f) as it:
+            for e in it:
+                if e.is_file() and e.name.lower().endswith(".png"):
+                    yield e.path
+
+def main():
+    """Pre-scale every target folder and report how many images were written."""
+    app = QCoreApplication(sys.argv)
+    app.setApplicationName("dbdPerkRoulette")  # same cache folder as main.py
+    done = failed = 0
+    for folder, size, nested in TARGETS:
+        if not os.path.isdir(folder):
+            print(f"[WARNING] Skipping missing folder: {folder}")
+            continue
+        for path in _pngs(folder, nested):
+            if prescale(path, size):
+                done += 1
+            else:
+                failed += 1
+                print(f"[WARNING] Could not decode {path}")
+    print(f"Pre-scaled {done} images ({failed} failed).")
+
+if __name__ == "__main__":
+    main()